@@ -1,13 +1,104 @@
 """Generate Bluesky-ready social copy for BioAI Weekly."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Sequence
+from typing import Dict, Iterable, Iterator, List, Sequence
 import html
 import os
 
 OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "output")
+os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+# Static chrome hoisted to module level so each render assembles only the
+# dynamic fragments.
+_STYLE = """\
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            background: #f4f6f8;
+            margin: 0;
+            padding: 20px;
+        }
+        .container {
+            max-width: 700px;
+            margin: 0 auto;
+            background: #ffffff;
+            border-radius: 8px;
+            box-shadow: 0 2px 12px rgba(0,0,0,0.08);
+            padding: 30px;
+        }
+        h1 {
+            margin-top: 0;
+            font-size: 1.8em;
+            color: #0077ff;
+        }
+        .meta {
+            color: #666;
+            margin-bottom: 25px;
+        }
+        .post {
+            margin-bottom: 25px;
+            position: relative;
+        }
+        .post-number {
+            font-weight: 600;
+            margin-bottom: 6px;
+            color: #333;
+        }
+        textarea {
+            width: 100%;
+            min-height: 110px;
+            resize: vertical;
+            padding: 12px;
+            border-radius: 6px;
+            border: 1px solid #d0d7de;
+            font-size: 0.95em;
+            line-height: 1.5;
+        }
+        button {
+            margin-top: 8px;
+            padding: 8px 16px;
+            background-color: #0077ff;
+            color: #fff;
+            border: none;
+            border-radius: 4px;
+            cursor: pointer;
+        }
+        button:hover {
+            background-color: #005ec2;
+        }
+"""
+
+_SCRIPT = """\
+        function copyPost(idx) {
+            const textarea = document.querySelectorAll('textarea')[idx - 1];
+            textarea.select();
+            textarea.setSelectionRange(0, 99999);
+            document.execCommand('copy');
+        }
+"""
+
+_SENTIMENT_MAP = {
+    'very_positive': 'very positive energy',
+    'positive': 'positive energy',
+    'neutral': 'mixed chatter',
+    'negative': 'cautious debate'
+}
+
+_QUIET_WEEK_POST = (
+    "Quiet week for BioAI — no qualifying stories met our filters, but we’ll be back with fresh signals soon."
+)
+_NO_TRENDS_POST = (
+    "No single theme dominated the BioAI feeds this week — the newsletter still has the best of the long tail!"
+)
+
+_POST_TEMPLATE = (
+    "<div class='post'>"
+    "<div class='post-number'>Post %d</div>"
+    "<textarea readonly>%s</textarea>"
+    "<button onclick=\"copyPost(%d)\">Copy</button>"
+    "</div>"
+)
 
 
 @dataclass
@@ -15,16 +106,13 @@ class BlueskyPost:
     """Represents a single Bluesky post in the generated thread."""
 
     text: str
+    escaped: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.escaped = html.escape(self.text)
 
     def to_html(self, idx: int) -> str:
-        escaped = html.escape(self.text)
-        return (
-            f"<div class='post'>"
-            f"<div class='post-number'>Post {idx}</div>"
-            f"<textarea readonly>{escaped}</textarea>"
-            f"<button onclick=\"copyPost({idx})\">Copy</button>"
-            f"</div>"
-        )
+        return _POST_TEMPLATE % (idx, self.escaped, idx)
 
 
 class BlueskyPostGenerator:
@@ -41,8 +129,7 @@ class BlueskyPostGenerator:
         filename: str | None = None
     ) -> str:
         posts = self._build_posts(articles, community_posts, trends)
-        html_doc = self._render_html(posts)
-        return self._save_html(html_doc, filename)
+        return self._save_html(self._iter_html_segments(posts), filename)
 
     # --- Post construction helpers -------------------------------------------------
 
@@ -62,11 +149,7 @@ class BlueskyPostGenerator:
         posts.append(BlueskyPost(intro))
 
         if not top_trends:
-            posts.append(
-                BlueskyPost(
-                    "No single theme dominated the BioAI feeds this week — the newsletter still has the best of the long tail!"
-                )
-            )
+            posts.append(BlueskyPost(_NO_TRENDS_POST))
         else:
             for trend in top_trends:
                 posts.append(BlueskyPost(self._trend_post(trend)))
@@ -81,15 +164,13 @@ class BlueskyPostGenerator:
         top_trends: Sequence[Dict]
     ) -> str:
         if total_articles == 0:
-            return "Quiet week for BioAI — no qualifying stories met our filters, but we’ll be back with fresh signals soon."
-
-        trend_tags = []
-        for trend in top_trends:
-            keyword = (trend.get('keyword') or '').strip()
-            if not keyword:
-                continue
-            tag = f"#{keyword.replace(' ', '')[:20]}"
-            trend_tags.append(tag)
+            return _QUIET_WEEK_POST
+
+        trend_tags = [
+            f"#{keyword.replace(' ', '')[:20]}"
+            for keyword in ((trend.get('keyword') or '').strip() for trend in top_trends)
+            if keyword
+        ]
         tags_text = " " + " ".join(trend_tags) if trend_tags else ""
 
         return (
@@ -100,13 +181,7 @@ class BlueskyPostGenerator:
         keyword = trend.get('keyword', 'BioAI')
         mentions = trend.get('mentions', 0)
         community_sentiment = trend.get('community_sentiment', 'neutral')
-        sentiment_map = {
-            'very_positive': 'very positive energy',
-            'positive': 'positive energy',
-            'neutral': 'mixed chatter',
-            'negative': 'cautious debate'
-        }
-        sentiment_phrase = sentiment_map.get(community_sentiment, 'mixed chatter')
+        sentiment_phrase = _SENTIMENT_MAP.get(community_sentiment, 'mixed chatter')
 
         respected_sources = [item.get('source') for item in trend.get('respected_sources', []) if item.get('source')]
         community_sources = [item.get('source', item.get('subreddit')) for item in trend.get('community_posts', []) if item.get('source') or item.get('subreddit')]
@@ -140,95 +215,45 @@ class BlueskyPostGenerator:
 
     # --- HTML rendering ------------------------------------------------------------
 
-    def _render_html(self, posts: Sequence[BlueskyPost]) -> str:
-        posts_html = "\n".join(post.to_html(idx + 1) for idx, post in enumerate(posts))
+    def _iter_html_segments(self, posts: Sequence[BlueskyPost]) -> Iterator[str]:
+        """Yield the document piecewise so it is never held in memory whole."""
         generated = datetime.now().strftime("%B %d, %Y")
 
-        return f"""<!DOCTYPE html>
-<html lang=\"en\">
-<head>
-    <meta charset=\"UTF-8\" />
-    <title>Bluesky Thread - BioAI Weekly</title>
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: #f4f6f8;
-            margin: 0;
-            padding: 20px;
-        }}
-        .container {{
-            max-width: 700px;
-            margin: 0 auto;
-            background: #ffffff;
-            border-radius: 8px;
-            box-shadow: 0 2px 12px rgba(0,0,0,0.08);
-            padding: 30px;
-        }}
-        h1 {{
-            margin-top: 0;
-            font-size: 1.8em;
-            color: #0077ff;
-        }}
-        .meta {{
-            color: #666;
-            margin-bottom: 25px;
-        }}
-        .post {{
-            margin-bottom: 25px;
-            position: relative;
-        }}
-        .post-number {{
-            font-weight: 600;
-            margin-bottom: 6px;
-            color: #333;
-        }}
-        textarea {{
-            width: 100%;
-            min-height: 110px;
-            resize: vertical;
-            padding: 12px;
-            border-radius: 6px;
-            border: 1px solid #d0d7de;
-            font-size: 0.95em;
-            line-height: 1.5;
-        }}
-        button {{
-            margin-top: 8px;
-            padding: 8px 16px;
-            background-color: #0077ff;
-            color: #fff;
-            border: none;
-            border-radius: 4px;
-            cursor: pointer;
-        }}
-        button:hover {{
-            background-color: #005ec2;
-        }}
-    </style>
-</head>
-<body>
-    <div class=\"container\">
-        <h1>BioAI Weekly • Bluesky Thread</h1>
-        <div class=\"meta\">Generated on {generated}</div>
-        {posts_html}
-    </div>
-    <script>
-        function copyPost(idx) {{
-            const textarea = document.querySelectorAll('textarea')[idx - 1];
-            textarea.select();
-            textarea.setSelectionRange(0, 99999);
-            document.execCommand('copy');
-        }}
-    </script>
-</body>
-</html>
-"""
+        yield (
+            "<!DOCTYPE html>\n"
+            "<html lang=\"en\">\n"
+            "<head>\n"
+            "    <meta charset=\"UTF-8\" />\n"
+            "    <title>Bluesky Thread - BioAI Weekly</title>\n"
+            "    <style>\n"
+        )
+        yield _STYLE
+        yield (
+            "    </style>\n"
+            "</head>\n"
+            "<body>\n"
+            "    <div class=\"container\">\n"
+            "        <h1>BioAI Weekly • Bluesky Thread</h1>\n"
+            f"        <div class=\"meta\">Generated on {generated}</div>\n        "
+        )
+        for idx, post in enumerate(posts):
+            yield post.to_html(idx + 1)
+        yield (
+            "\n    </div>\n"
+            "    <script>\n"
+        )
+        yield _SCRIPT
+        yield (
+            "    </script>\n"
+            "</body>\n"
+            "</html>\n"
+        )
 
-    def _save_html(self, html_doc: str, filename: str | None) -> str:
+    def _save_html(self, segments: Iterable[str], filename: str | None) -> str:
         if not filename:
             filename = f"bluesky_thread_{datetime.now().strftime('%Y%m%d')}.html"
-        filepath = f"{OUTPUT_DIR}/{filename}"
+        filepath = os.path.join(OUTPUT_DIR, filename)
         with open(filepath, 'w', encoding='utf-8') as handle:
-            handle.write(html_doc)
+            handle.writelines(segments)
         print(f"🐦 Bluesky thread saved to {filepath}")
         return filepath
@@ -1,10 +1,15 @@
 import requests
-import feedparser
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+import heapq
+
+from defusedxml import ElementTree as SafeElementTree
+from typing import Iterator, List, Dict, Optional
 import re
 
-from bio_ai_topic_filter import TopicMatch, analyze_text_for_bio_ai
+from bio_ai_topic_filter import TopicMatch, analyze_lowered, analyze_text_for_bio_ai
+
 
 class CommunityAggregator:
     """Aggregate AI community chatter beyond Reddit."""
@@ -12,8 +17,13 @@ class CommunityAggregator:
     def __init__(self):
         self.hacker_news_endpoint = "https://hn.algolia.com/api/v1/search_by_date"
         self.techmeme_feed = "https://www.techmeme.com/feed.xml"
-        self.positive_words = ['amazing', 'incredible', 'breakthrough', 'exciting', 'love', 'awesome', 'great']
-        self.negative_words = ['terrible', 'awful', 'concerning', 'worried', 'scary', 'dangerous', 'hate']
+        # Persistent session keeps the TCP/TLS connection alive across calls.
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': 'bioai-newsletter/1.0'})
+
+    def close(self) -> None:
+        """Release the pooled HTTP connections."""
+        self.session.close()
 
     def clean_text(self, text: Optional[str]) -> str:
         if not text:
@@ -24,11 +34,7 @@ class CommunityAggregator:
     def extract_keywords(self, text: str) -> TopicMatch:
         return analyze_text_for_bio_ai(text)
 
-    def get_sentiment_indicators(self, text: str, score: int) -> str:
-        text_lower = text.lower()
-        positive_count = sum(1 for word in self.positive_words if word in text_lower)
-        negative_count = sum(1 for word in self.negative_words if word in text_lower)
-
+    def get_sentiment_indicators(self, positive_count: int, negative_count: int, score: int) -> str:
         if score > 150 and positive_count >= negative_count:
             return 'very_positive'
         if score > 60 and positive_count >= negative_count:
@@ -49,7 +55,7 @@ class CommunityAggregator:
         }
 
         try:
-            response = requests.get(self.hacker_news_endpoint, params=params, timeout=10)
+            response = self.session.get(self.hacker_news_endpoint, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
         except Exception as exc:
@@ -62,21 +68,20 @@ class CommunityAggregator:
             url = hit.get('url') or f"https://news.ycombinator.com/item?id={hit.get('objectID')}"
             story_text = self.clean_text(hit.get('story_text'))
             combined_text = f"{title} {story_text}".strip()
-            keyword_match = self.extract_keywords(combined_text)
+            keyword_match, positive_count, negative_count = analyze_lowered(combined_text.lower())
 
             if not keyword_match.is_bio_ai:
                 continue
 
+            # The HN API already returns ISO-8601; normalize the Z suffix
+            # without a parse/format roundtrip.
             created_at = hit.get('created_at') or ''
-            try:
-                created_iso = datetime.fromisoformat(created_at.replace('Z', '+00:00')).isoformat()
-            except Exception:
-                created_iso = created_at
+            created_iso = created_at[:-1] + '+00:00' if created_at.endswith('Z') else created_at
 
             score = hit.get('points', 0) or 0
             comments = hit.get('num_comments', 0) or 0
 
-            sentiment = self.get_sentiment_indicators(combined_text, score)
+            sentiment = self.get_sentiment_indicators(positive_count, negative_count, score)
 
             stories.append({
                 'source': 'Hacker News',
@@ -97,10 +102,50 @@ class CommunityAggregator:
         print(f"✓ Hacker News: {len(stories)} relevant stories")
         return stories
 
+    @staticmethod
+    def _iter_feed_items(source) -> Iterator[Dict]:
+        """Stream ``<item>`` elements from an RSS byte stream.
+
+        Pulls only the fields fetch_techmeme consumes instead of building
+        feedparser's full object graph, clearing each element as it goes.
+        """
+        dc_creator = '{http://purl.org/dc/elements/1.1/}creator'
+        for _event, element in SafeElementTree.iterparse(source, events=('end',)):
+            if element.tag != 'item':
+                continue
+            yield {
+                'title': element.findtext('title', ''),
+                'summary': element.findtext('description', ''),
+                'link': element.findtext('link', ''),
+                'pub_date': element.findtext('pubDate'),
+                'author': element.findtext(dc_creator),
+            }
+            element.clear()
+
+    @staticmethod
+    def _parse_pub_date(pub_date: Optional[str]) -> Optional[datetime]:
+        """Parse an RFC 2822 pubDate into a naive UTC datetime."""
+        if not pub_date:
+            return None
+        try:
+            parsed = parsedate_to_datetime(pub_date)
+        except (TypeError, ValueError):
+            return None
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+        return parsed
+
     def fetch_techmeme(self, days_back: int = 7, limit: int = 30) -> List[Dict]:
         """Parse Techmeme feed and keep AI-focused items."""
         try:
-            feed = feedparser.parse(self.techmeme_feed)
+            response = self.session.get(self.techmeme_feed, stream=True, timeout=10)
+            response.raise_for_status()
+            response.raw.decode_content = True
+            entries = []
+            for entry in self._iter_feed_items(response.raw):
+                entries.append(entry)
+                if len(entries) >= limit:
+                    break
         except Exception as exc:
             print(f"✗ Error parsing Techmeme feed: {exc}")
             return []
@@ -108,39 +153,37 @@ class CommunityAggregator:
         cutoff_date = datetime.utcnow() - timedelta(days=days_back)
         posts: List[Dict] = []
 
-        for entry in feed.entries[:limit]:
-            title = self.clean_text(entry.get('title', ''))
-            summary = self.clean_text(entry.get('summary', ''))
+        for entry in entries:
+            title = self.clean_text(entry['title'])
+            summary = self.clean_text(entry['summary'])
             content = f"{title} {summary}"
-            keyword_match = self.extract_keywords(content)
+            keyword_match, positive_count, negative_count = analyze_lowered(content.lower())
 
             if not keyword_match.is_bio_ai:
                 continue
 
-            published = None
-            if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                published = datetime(*entry.published_parsed[:6])
-            elif hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-                published = datetime(*entry.updated_parsed[:6])
+            published = self._parse_pub_date(entry['pub_date'])
 
+            # The feed is ordered newest-first, so everything after the
+            # first stale entry is also stale.
             if published and published < cutoff_date:
-                continue
+                break
 
             published_iso = published.isoformat() if published else None
             score_proxy = 20  # Techmeme lacks votes; assign a modest weight for trend scoring.
 
-            sentiment = self.get_sentiment_indicators(content, score_proxy)
+            sentiment = self.get_sentiment_indicators(positive_count, negative_count, score_proxy)
 
             posts.append({
                 'source': 'Techmeme',
                 'subreddit': 'Techmeme',
                 'title': title,
                 'summary': summary[:300] + '...' if len(summary) > 300 else summary,
-                'link': entry.get('link', ''),
+                'link': entry['link'],
                 'score': score_proxy,
                 'num_comments': 0,
                 'created_utc': published_iso,
-                'author': entry.get('author', 'Techmeme Editors'),
+                'author': entry['author'] or 'Techmeme Editors',
                 'keywords': keyword_match.keywords,
                 'sentiment': sentiment,
                 'type': 'community',
@@ -152,10 +195,20 @@ class CommunityAggregator:
 
     def gather(self, days_back: int = 7) -> List[Dict]:
         """Collect all community stories beyond Reddit."""
-        hacker_news = self.fetch_hacker_news(days_back=days_back)
-        techmeme = self.fetch_techmeme(days_back=days_back)
-        combined = hacker_news + techmeme
-        combined.sort(key=lambda item: item.get('created_utc', ''), reverse=True)
+        # Both fetches are network-bound; running them concurrently makes
+        # gather() cost max(t_hn, t_techmeme) instead of the sum.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            hn_future = executor.submit(self.fetch_hacker_news, days_back=days_back)
+            techmeme_future = executor.submit(self.fetch_techmeme, days_back=days_back)
+            hacker_news = hn_future.result()
+            techmeme = techmeme_future.result()
+
+        # Each source arrives newest-first, so the per-list sorts are O(N)
+        # Timsort passes and the merge is linear instead of a combined sort.
+        sort_key = lambda item: item.get('created_utc') or ''
+        hacker_news.sort(key=sort_key, reverse=True)
+        techmeme.sort(key=sort_key, reverse=True)
+        combined = list(heapq.merge(hacker_news, techmeme, key=sort_key, reverse=True))
         print(f"\n📰 Additional community signals collected: {len(combined)}")
         return combined
 
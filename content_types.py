@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 
 @dataclass
@@ -22,26 +22,34 @@ class SocialPost:
     generated_at: datetime = field(default_factory=datetime.now)
     model_used: str = "claude-sonnet-4-6"
     citations: List[str] = field(default_factory=list)
+    # Lazily filled (word_count, char_count) per platform; content is
+    # effectively immutable once generated, so no invalidation is needed.
+    _count_cache: Dict[str, Tuple[int, int]] = field(default_factory=dict, repr=False)
+
+    def _platform_counts(self, platform: str) -> Tuple[int, int]:
+        counts = self._count_cache.get(platform)
+        if counts is None:
+            if platform == "linkedin":
+                counts = (len(self.linkedin_post.split()), len(self.linkedin_post))
+            elif platform == "blog":
+                counts = (len(self.blog_content.split()), len(self.blog_content))
+            elif platform == "bluesky":
+                counts = (
+                    sum(len(post.split()) for post in self.bluesky_posts),
+                    sum(len(post) for post in self.bluesky_posts),
+                )
+            else:
+                counts = (0, 0)
+            self._count_cache[platform] = counts
+        return counts
 
     def word_count(self, platform: str) -> int:
         """Return word count for specified platform content."""
-        if platform == "linkedin":
-            return len(self.linkedin_post.split())
-        elif platform == "blog":
-            return len(self.blog_content.split())
-        elif platform == "bluesky":
-            return sum(len(post.split()) for post in self.bluesky_posts)
-        return 0
+        return self._platform_counts(platform)[0]
 
     def char_count(self, platform: str) -> int:
         """Return character count for specified platform content."""
-        if platform == "linkedin":
-            return len(self.linkedin_post)
-        elif platform == "blog":
-            return len(self.blog_content)
-        elif platform == "bluesky":
-            return sum(len(post) for post in self.bluesky_posts)
-        return 0
+        return self._platform_counts(platform)[1]
 
 
 @dataclass
@@ -54,14 +62,14 @@ class WeeklySocialContent:
     week_end: Optional[str] = None
     total_articles_analyzed: int = 0
     total_community_posts: int = 0
+    # Parallel id index for O(1) lookup; posts keeps iteration order.
+    _index: Dict[str, SocialPost] = field(default_factory=dict, repr=False)
 
     def add_post(self, post: SocialPost) -> None:
         """Add a social post to the collection."""
         self.posts.append(post)
+        self._index[post.id] = post
 
     def get_post_by_id(self, post_id: str) -> Optional[SocialPost]:
         """Find a post by its ID."""
-        for post in self.posts:
-            if post.id == post_id:
-                return post
-        return None
+        return self._index.get(post_id)
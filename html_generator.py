@@ -1,361 +1,57 @@
 """Generate tabbed HTML output for social content with dark theme."""
 from __future__ import annotations
 
-import html
+import gzip
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import Iterable, Iterator, List
 
 from content_types import SocialPost, WeeklySocialContent
 
 OUTPUT_DIR = Path(__file__).parent / "output"
 
-
-class HTMLGenerator:
-    """Generates unified tabbed HTML output for Bluesky, LinkedIn, and Blog content."""
-
-    def generate_html(self, content: WeeklySocialContent, filename: str = None) -> str:
-        """Generate complete HTML document with tabbed content.
-
-        Args:
-            content: WeeklySocialContent with all generated posts
-            filename: Optional custom filename
-
-        Returns:
-            Path to saved HTML file
-        """
-        posts_html = self._render_posts(content.posts)
-        generated_date = datetime.now().strftime("%B %d, %Y")
-
-        html_doc = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>BioAI Weekly Social Content - {generated_date}</title>
-    <meta name="description" content="Weekly social content for BioAI newsletter across Bluesky, LinkedIn, and Blog">
-    <style>
-    {self._get_css()}
-    </style>
-</head>
-<body>
-    <header class="hero">
-        <div class="container">
-            <div class="hero-content">
-                <div class="hero-badge">
-                    <span>Weekly Content</span>
-                </div>
-                <h1>BioAI Weekly</h1>
-                <p class="subtitle">Social Content for Bluesky, LinkedIn & Blog</p>
-                <div class="hero-meta">
-                    <div class="hero-meta-item">
-                        <p class="label">Week Of</p>
-                        <p class="value">{content.week_end or generated_date}</p>
-                    </div>
-                    <div class="hero-meta-item">
-                        <p class="label">Articles Analyzed</p>
-                        <p class="value">{content.total_articles_analyzed}</p>
-                    </div>
-                    <div class="hero-meta-item">
-                        <p class="label">Community Posts</p>
-                        <p class="value">{content.total_community_posts}</p>
-                    </div>
-                    <div class="hero-meta-item">
-                        <p class="label">Topics</p>
-                        <p class="value">{len(content.posts)}</p>
-                    </div>
-                </div>
-            </div>
-        </div>
-    </header>
-
-    <main>
-        <div class="container">
-            <section class="content-section">
-                <div class="section-header">
-                    <h2>
-                        <div class="section-icon">
-                            <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                                <path d="M12 20h9"/>
-                                <path d="M16.5 3.5a2.121 2.121 0 0 1 3 3L7 19l-4 1 1-4L16.5 3.5z"/>
-                            </svg>
-                        </div>
-                        Social Content
-                    </h2>
-                </div>
-
-                {posts_html}
-            </section>
-        </div>
-    </main>
-
-    <footer>
-        <div class="container">
-            <div class="footer-content">
-                <div class="footer-logo">BioAI Weekly</div>
-                <p class="footer-text">AI-generated social content for biology and AI research</p>
-                <div class="footer-meta">
-                    <span>Generated on {generated_date}</span>
-                    <span>Model: Claude Sonnet 4.6</span>
-                </div>
-            </div>
-        </div>
-    </footer>
-
-    <script>
-    {self._get_javascript()}
-    </script>
-</body>
-</html>"""
-
-        return self._save_html(html_doc, filename)
-
-    def _render_posts(self, posts: List[SocialPost]) -> str:
-        """Render all posts as HTML cards with tabs."""
-        if not posts:
-            return '<p class="no-content">No content generated this week.</p>'
-
-        cards = []
-        for post in posts:
-            cards.append(self._render_post_card(post))
-
-        return "\n".join(cards)
-
-    def _render_post_card(self, post: SocialPost) -> str:
-        """Render a single post as a tabbed card."""
-        post_id = post.id
-
-        # Bluesky content (thread)
-        bluesky_html = self._render_bluesky_thread(post.bluesky_posts, post_id)
-
-        # LinkedIn content
-        linkedin_html = self._render_linkedin(post.linkedin_post, post_id)
-
-        # Blog content
-        blog_html = self._render_blog(
-            post.blog_title,
-            post.blog_content,
-            post.blog_meta_description,
-            post_id
-        )
-
-        return f"""
-        <article class="post-card" data-post-id="{post_id}">
-            <header class="post-header">
-                <h3 class="post-title">{html.escape(post.topic_keyword.title())}</h3>
-                <p class="post-source">
-                    <span>Topic</span>
-                    {self._render_source_link(post)}
-                </p>
-            </header>
-
-            <div class="platform-tabs">
-                <button class="platform-tab active" data-platform="bluesky" onclick="switchTab('{post_id}', 'bluesky')">
-                    <svg viewBox="0 0 24 24" fill="currentColor">
-                        <path d="M12 2C6.477 2 2 6.477 2 12c0 4.991 3.657 9.128 8.438 9.879V14.89h-2.54V12h2.54V9.797c0-2.506 1.492-3.89 3.777-3.89 1.094 0 2.238.195 2.238.195v2.46h-1.26c-1.243 0-1.63.771-1.63 1.562V12h2.773l-.443 2.89h-2.33v6.989C18.343 21.129 22 16.99 22 12c0-5.523-4.477-10-10-10z"/>
-                    </svg>
-                    Bluesky
-                </button>
-                <button class="platform-tab" data-platform="linkedin" onclick="switchTab('{post_id}', 'linkedin')">
-                    <svg viewBox="0 0 24 24" fill="currentColor">
-                        <path d="M19 0h-14c-2.761 0-5 2.239-5 5v14c0 2.761 2.239 5 5 5h14c2.762 0 5-2.239 5-5v-14c0-2.761-2.238-5-5-5zm-11 19h-3v-11h3v11zm-1.5-12.268c-.966 0-1.75-.79-1.75-1.764s.784-1.764 1.75-1.764 1.75.79 1.75 1.764-.783 1.764-1.75 1.764zm13.5 12.268h-3v-5.604c0-3.368-4-3.113-4 0v5.604h-3v-11h3v1.765c1.396-2.586 7-2.777 7 2.476v6.759z"/>
-                    </svg>
-                    LinkedIn
-                </button>
-                <button class="platform-tab" data-platform="blog" onclick="switchTab('{post_id}', 'blog')">
-                    <svg viewBox="0 0 24 24" fill="currentColor">
-                        <path d="M19 5v14H5V5h14m0-2H5c-1.1 0-2 .9-2 2v14c0 1.1.9 2 2 2h14c1.1 0 2-.9 2-2V5c0-1.1-.9-2-2-2zm-5 14H7v-2h7v2zm3-4H7v-2h10v2zm0-4H7V7h10v2z"/>
-                    </svg>
-                    Blog
-                </button>
-            </div>
-
-            <!-- Bluesky Content -->
-            {bluesky_html}
-
-            <!-- LinkedIn Content -->
-            {linkedin_html}
-
-            <!-- Blog Content -->
-            {blog_html}
-        </article>
-"""
-
-    def _render_bluesky_thread(self, posts: List[str], post_id: str) -> str:
-        """Render Bluesky thread posts."""
-        if not posts:
-            return '<div class="platform-content active" data-platform="bluesky"><p>No Bluesky content generated.</p></div>'
-
-        thread_html = []
-        for i, post_text in enumerate(posts, 1):
-            escaped = html.escape(post_text)
-            char_count = len(post_text)
-            thread_html.append(f"""
-                <div class="thread-post">
-                    <div class="thread-number">Post {i}/{len(posts)}</div>
-                    <div id="bs_{post_id}_{i}" class="content-text">{escaped}</div>
-                    <div class="content-footer">
-                        <span class="word-count">{char_count} chars</span>
-                        <button class="copy-button" onclick="copyToClipboard('bs_{post_id}_{i}', this)">
-                            <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><rect x="9" y="9" width="13" height="13" rx="2" ry="2"/><path d="M5 15H4a2 2 0 0 1-2-2V4a2 2 0 0 1 2-2h9a2 2 0 0 1 2 2v1"/></svg>
-                            Copy
-                        </button>
-                    </div>
-                </div>
-            """)
-
-        total_chars = sum(len(p) for p in posts)
-        copy_all_text = "\\n\\n".join(posts)
-
-        return f"""
-            <div class="platform-content active" data-platform="bluesky">
-                <div class="thread-container">
-                    {"".join(thread_html)}
-                </div>
-                <div class="content-footer thread-footer">
-                    <span class="word-count">Thread: {len(posts)} posts, {total_chars} total chars</span>
-                    <button class="copy-button" onclick="copyThread('{post_id}', {len(posts)}, this)">
-                        <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><rect x="9" y="9" width="13" height="13" rx="2" ry="2"/><path d="M5 15H4a2 2 0 0 1-2-2V4a2 2 0 0 1 2-2h9a2 2 0 0 1 2 2v1"/></svg>
-                        Copy All
-                    </button>
-                </div>
-            </div>
-        """
-
-    def _render_linkedin(self, content: str, post_id: str) -> str:
-        """Render LinkedIn post content."""
-        if not content:
-            return '<div class="platform-content" data-platform="linkedin"><p>No LinkedIn content generated.</p></div>'
-
-        # Convert paragraphs
-        paragraphs = content.split("\n\n")
-        formatted = "".join(f"<p>{html.escape(p)}</p>" for p in paragraphs if p.strip())
-
-        word_count = len(content.split())
-
-        return f"""
-            <div class="platform-content" data-platform="linkedin">
-                <div id="li_{post_id}" class="content-text">
-                    {formatted}
-                </div>
-                <div class="content-footer">
-                    <span class="word-count">{word_count} words</span>
-                    <button class="copy-button" onclick="copyToClipboard('li_{post_id}', this)">
-                        <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><rect x="9" y="9" width="13" height="13" rx="2" ry="2"/><path d="M5 15H4a2 2 0 0 1-2-2V4a2 2 0 0 1 2-2h9a2 2 0 0 1 2 2v1"/></svg>
-                        Copy
-                    </button>
-                </div>
-            </div>
-        """
-
-    def _render_blog(
-        self, title: str, content: str, meta: str, post_id: str
-    ) -> str:
-        """Render blog post content with markdown-style formatting."""
-        if not content:
-            return '<div class="platform-content" data-platform="blog"><p>No blog content generated.</p></div>'
-
-        # Convert markdown-style headers and formatting
-        formatted = self._markdown_to_html(content)
-        word_count = len(content.split())
-
-        return f"""
-            <div class="platform-content" data-platform="blog">
-                <div class="blog-title-display">{html.escape(title)}</div>
-                <div id="blog_{post_id}" class="blog-content">
-                    {formatted}
-                </div>
-                <div class="blog-meta">
-                    <div class="blog-meta-title">Post Metadata</div>
-                    <dl>
-                        <dt>Title</dt>
-                        <dd>{html.escape(title)}</dd>
-                        <dt>Meta Description</dt>
-                        <dd>{html.escape(meta)}</dd>
-                        <dt>Word Count</dt>
-                        <dd>{word_count} words</dd>
-                    </dl>
-                </div>
-                <div class="content-footer">
-                    <span class="word-count">{word_count} words</span>
-                    <button class="copy-button" onclick="copyToClipboard('blog_{post_id}', this)">
-                        <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><rect x="9" y="9" width="13" height="13" rx="2" ry="2"/><path d="M5 15H4a2 2 0 0 1-2-2V4a2 2 0 0 1 2-2h9a2 2 0 0 1 2 2v1"/></svg>
-                        Copy
-                    </button>
-                </div>
-            </div>
-        """
-
-    def _markdown_to_html(self, text: str) -> str:
-        """Convert basic markdown to HTML."""
-        lines = text.split("\n")
-        result = []
-        in_list = False
-        list_type = None
-
-        for line in lines:
-            stripped = line.strip()
-
-            # Headers
-            if stripped.startswith("## "):
-                if in_list:
-                    result.append(f"</{list_type}>")
-                    in_list = False
-                result.append(f"<h2>{html.escape(stripped[3:])}</h2>")
-            elif stripped.startswith("### "):
-                if in_list:
-                    result.append(f"</{list_type}>")
-                    in_list = False
-                result.append(f"<h3>{html.escape(stripped[4:])}</h3>")
-            # Bullet lists
-            elif stripped.startswith("- ") or stripped.startswith("* "):
-                if not in_list or list_type != "ul":
-                    if in_list:
-                        result.append(f"</{list_type}>")
-                    result.append("<ul>")
-                    in_list = True
-                    list_type = "ul"
-                result.append(f"<li>{html.escape(stripped[2:])}</li>")
-            # Numbered lists
-            elif re.match(r"^\d+\.\s", stripped):
-                if not in_list or list_type != "ol":
-                    if in_list:
-                        result.append(f"</{list_type}>")
-                    result.append("<ol>")
-                    in_list = True
-                    list_type = "ol"
-                content = re.sub(r"^\d+\.\s", "", stripped)
-                result.append(f"<li>{html.escape(content)}</li>")
-            # Paragraphs
-            elif stripped:
-                if in_list:
-                    result.append(f"</{list_type}>")
-                    in_list = False
-                # Handle bold and inline code
-                escaped = html.escape(stripped)
-                escaped = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", escaped)
-                escaped = re.sub(r"`(.+?)`", r"<code>\1</code>", escaped)
-                result.append(f"<p>{escaped}</p>")
-
-        if in_list:
-            result.append(f"</{list_type}>")
-
-        return "\n".join(result)
-
-    def _render_source_link(self, post: SocialPost) -> str:
-        """Render source link if available."""
-        if post.source_articles:
-            first_article = post.source_articles[0]
-            link = first_article.get("link") or first_article.get("url")
-            if link:
-                return f' &bull; <a href="{html.escape(link)}" target="_blank" rel="noopener">View Source</a>'
-        return ""
-
-    def _get_css(self) -> str:
-        """Return the CSS styles (dark theme matching benchmarking_deepdive)."""
-        return """
+# strftime formats shared by the render and save paths.
+_HUMAN_FMT = "%B %d, %Y"
+_FILE_FMT = "%Y%m%d"
+
+# Markdown patterns compiled once; the inline alternation handles bold and
+# code in a single engine pass per paragraph instead of two sequential subs,
+# and the block pattern classifies header/list markers while capturing the
+# line body in the same match.
+_MD_BLOCK_RE = re.compile(r"^(## |### |[-*] |\d+\.\s)(.*)$")
+_MD_INLINE_RE = re.compile(r"\*\*(.+?)\*\*|`(.+?)`")
+# Any block or inline marker the renderer reacts to; absence means the text
+# is plain paragraphs and the state machine can be skipped entirely.
+_MD_MARKERS_RE = re.compile(r"(?m)^\s*(#{2,3} |[-*] |\d+\.\s)|\*\*|`")
+
+
+def _md_inline_repl(match: "re.Match[str]") -> str:
+    bold = match.group(1)
+    if bold is not None:
+        return f"<strong>{bold}</strong>"
+    return f"<code>{match.group(2)}</code>"
+
+
+# Same five characters html.escape covers, but one C-level translate pass
+# instead of up to five sequential str.replace scans.
+_HTML_ESCAPE_TABLE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+})
+
+
+def _escape(text: str) -> str:
+    return text.translate(_HTML_ESCAPE_TABLE)
+
+# Static assets hoisted to module level so each render reuses the same
+# string objects instead of re-evaluating ~9KB of literals per call.
+_CSS_STYLES = """
     @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&family=JetBrains+Mono:wght@400;500&display=swap');
 
     :root {
@@ -867,9 +563,7 @@ class HTMLGenerator:
     }
 """
 
-    def _get_javascript(self) -> str:
-        """Return the JavaScript for tab switching and copy functionality."""
-        return """
+_JS_CODE = """
     function switchTab(postId, platform) {
         const card = document.querySelector(`[data-post-id="${postId}"]`);
         if (!card) return;
@@ -917,16 +611,452 @@ class HTMLGenerator:
     }
 """
 
-    def _save_html(self, html_doc: str, filename: str = None) -> str:
-        """Save HTML to output directory."""
+
+# Every icon's path data is emitted once here and referenced via <use>,
+# instead of repeating the full <path> per card, tab, and copy button.
+_SVG_SPRITE = """
+    <svg xmlns="http://www.w3.org/2000/svg" style="display:none" aria-hidden="true">
+        <symbol id="icon-edit" viewBox="0 0 24 24">
+            <path d="M12 20h9"/>
+            <path d="M16.5 3.5a2.121 2.121 0 0 1 3 3L7 19l-4 1 1-4L16.5 3.5z"/>
+        </symbol>
+        <symbol id="icon-bluesky" viewBox="0 0 24 24">
+            <path d="M12 2C6.477 2 2 6.477 2 12c0 4.991 3.657 9.128 8.438 9.879V14.89h-2.54V12h2.54V9.797c0-2.506 1.492-3.89 3.777-3.89 1.094 0 2.238.195 2.238.195v2.46h-1.26c-1.243 0-1.63.771-1.63 1.562V12h2.773l-.443 2.89h-2.33v6.989C18.343 21.129 22 16.99 22 12c0-5.523-4.477-10-10-10z"/>
+        </symbol>
+        <symbol id="icon-linkedin" viewBox="0 0 24 24">
+            <path d="M19 0h-14c-2.761 0-5 2.239-5 5v14c0 2.761 2.239 5 5 5h14c2.762 0 5-2.239 5-5v-14c0-2.761-2.238-5-5-5zm-11 19h-3v-11h3v11zm-1.5-12.268c-.966 0-1.75-.79-1.75-1.764s.784-1.764 1.75-1.764 1.75.79 1.75 1.764-.783 1.764-1.75 1.764zm13.5 12.268h-3v-5.604c0-3.368-4-3.113-4 0v5.604h-3v-11h3v1.765c1.396-2.586 7-2.777 7 2.476v6.759z"/>
+        </symbol>
+        <symbol id="icon-blog" viewBox="0 0 24 24">
+            <path d="M19 5v14H5V5h14m0-2H5c-1.1 0-2 .9-2 2v14c0 1.1.9 2 2 2h14c1.1 0 2-.9 2-2V5c0-1.1-.9-2-2-2zm-5 14H7v-2h7v2zm3-4H7v-2h10v2zm0-4H7V7h10v2z"/>
+        </symbol>
+        <symbol id="icon-copy" viewBox="0 0 24 24">
+            <rect x="9" y="9" width="13" height="13" rx="2" ry="2"/>
+            <path d="M5 15H4a2 2 0 0 1-2-2V4a2 2 0 0 1 2-2h9a2 2 0 0 1 2 2v1"/>
+        </symbol>
+    </svg>
+"""
+
+# Card shell shared by every post: the static markup (tabs, icons, comments)
+# is allocated once and each render is a single format_map pass filling the
+# six dynamic slots.
+_CARD_TEMPLATE = """
+        <article class="post-card" data-post-id="{post_id}">
+            <header class="post-header">
+                <h3 class="post-title">{title}</h3>
+                <p class="post-source">
+                    <span>Topic</span>
+                    {source_link}
+                </p>
+            </header>
+
+            <div class="platform-tabs">
+                <button class="platform-tab active" data-platform="bluesky" onclick="switchTab('{post_id}', 'bluesky')">
+                    <svg viewBox="0 0 24 24" fill="currentColor"><use href="#icon-bluesky"/></svg>
+                    Bluesky
+                </button>
+                <button class="platform-tab" data-platform="linkedin" onclick="switchTab('{post_id}', 'linkedin')">
+                    <svg viewBox="0 0 24 24" fill="currentColor"><use href="#icon-linkedin"/></svg>
+                    LinkedIn
+                </button>
+                <button class="platform-tab" data-platform="blog" onclick="switchTab('{post_id}', 'blog')">
+                    <svg viewBox="0 0 24 24" fill="currentColor"><use href="#icon-blog"/></svg>
+                    Blog
+                </button>
+            </div>
+
+            <!-- Bluesky Content -->
+            {bluesky}
+
+            <!-- LinkedIn Content -->
+            {linkedin}
+
+            <!-- Blog Content -->
+            {blog}
+        </article>
+"""
+
+# Document skeleton precompiled at import as alternating static/templated
+# segments: the brace-heavy CSS/JS stay verbatim while the surrounding
+# markup is a format_map pass over a shared template string, so each
+# generate_html call formats only the handful of dynamic values.
+_DOC_HEAD_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>BioAI Weekly Social Content - {generated_date}</title>
+    <meta name="description" content="Weekly social content for BioAI newsletter across Bluesky, LinkedIn, and Blog">
+    <style>
+    """
+
+_DOC_BODY_TEMPLATE = (
+    """
+    </style>
+</head>
+<body>"""
+    + _SVG_SPRITE
+    + """    <header class="hero">
+        <div class="container">
+            <div class="hero-content">
+                <div class="hero-badge">
+                    <span>Weekly Content</span>
+                </div>
+                <h1>BioAI Weekly</h1>
+                <p class="subtitle">Social Content for Bluesky, LinkedIn & Blog</p>
+                <div class="hero-meta">
+                    <div class="hero-meta-item">
+                        <p class="label">Week Of</p>
+                        <p class="value">{week_of}</p>
+                    </div>
+                    <div class="hero-meta-item">
+                        <p class="label">Articles Analyzed</p>
+                        <p class="value">{total_articles}</p>
+                    </div>
+                    <div class="hero-meta-item">
+                        <p class="label">Community Posts</p>
+                        <p class="value">{total_community}</p>
+                    </div>
+                    <div class="hero-meta-item">
+                        <p class="label">Topics</p>
+                        <p class="value">{topic_count}</p>
+                    </div>
+                </div>
+            </div>
+        </div>
+    </header>
+
+    <main>
+        <div class="container">
+            <section class="content-section">
+                <div class="section-header">
+                    <h2>
+                        <div class="section-icon">
+                            <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><use href="#icon-edit"/></svg>
+                        </div>
+                        Social Content
+                    </h2>
+                </div>
+
+                {posts_html}
+            </section>
+        </div>
+    </main>
+
+    <footer>
+        <div class="container">
+            <div class="footer-content">
+                <div class="footer-logo">BioAI Weekly</div>
+                <p class="footer-text">AI-generated social content for biology and AI research</p>
+                <div class="footer-meta">
+                    <span>Generated on {generated_date}</span>
+                    <span>Model: Claude Sonnet 4.6</span>
+                </div>
+            </div>
+        </div>
+    </footer>
+
+    <script>
+    """
+)
+
+_DOC_TAIL = """
+    </script>
+</body>
+</html>"""
+
+# Split the body template around the posts placeholder once at import so the
+# cards can be streamed straight into the file between the two halves.
+_DOC_HERO_TEMPLATE, _, _DOC_FOOTER_TEMPLATE = _DOC_BODY_TEMPLATE.partition("{posts_html}")
+
+
+class HTMLGenerator:
+    """Generates unified tabbed HTML output for Bluesky, LinkedIn, and Blog content."""
+
+    def generate_html(self, content: WeeklySocialContent, filename: str = None) -> str:
+        """Generate complete HTML document with tabbed content.
+
+        Args:
+            content: WeeklySocialContent with all generated posts
+            filename: Optional custom filename
+
+        Returns:
+            Path to saved HTML file
+        """
+        # One clock read per generation, shared with the default filename.
+        now = datetime.now()
+        generated_date = now.strftime(_HUMAN_FMT)
+
+        context = {
+            "generated_date": generated_date,
+            "week_of": content.week_end or generated_date,
+            "total_articles": content.total_articles_analyzed,
+            "total_community": content.total_community_posts,
+            "topic_count": len(content.posts),
+        }
+        return self._save_html(self._iter_html_segments(content.posts, context), filename, now)
+
+    def _iter_html_segments(self, posts: List[SocialPost], context: dict) -> Iterator[str]:
+        """Yield the document piecewise so only one card is in memory at a time."""
+        yield _DOC_HEAD_TEMPLATE.format_map(context)
+        yield _CSS_STYLES
+        yield _DOC_HERO_TEMPLATE.format_map(context)
+        yield from self._iter_posts(posts)
+        yield _DOC_FOOTER_TEMPLATE.format_map(context)
+        yield _JS_CODE
+        yield _DOC_TAIL
+
+    def _iter_posts(self, posts: List[SocialPost]) -> Iterator[str]:
+        """Render all posts as HTML cards with tabs, one card per chunk."""
+        if not posts:
+            yield '<p class="no-content">No content generated this week.</p>'
+            return
+
+        # Card rendering is independent per post and dominated by C-level
+        # regex/translate work that releases the GIL, so larger weeks fan
+        # out across a small thread pool; tiny weeks skip the pool overhead.
+        if len(posts) >= 4:
+            with ThreadPoolExecutor(max_workers=min(8, len(posts))) as executor:
+                for card in executor.map(self._render_post_card, posts):
+                    yield card
+                    yield "\n"
+            return
+
+        for post in posts:
+            yield self._render_post_card(post)
+            yield "\n"
+
+    def _render_post_card(self, post: SocialPost) -> str:
+        """Render a single post as a tabbed card."""
+        post_id = post.id
+
+        return _CARD_TEMPLATE.format_map({
+            "post_id": post_id,
+            "title": _escape(post.topic_keyword.title()),
+            "source_link": self._render_source_link(post),
+            "bluesky": self._render_bluesky_thread(post.bluesky_posts, post_id),
+            "linkedin": self._render_linkedin(post.linkedin_post, post_id),
+            "blog": self._render_blog(
+                post.blog_title,
+                post.blog_content,
+                post.blog_meta_description,
+                post_id
+            ),
+        })
+
+    def _render_bluesky_thread(self, posts: List[str], post_id: str) -> str:
+        """Render Bluesky thread posts."""
+        if not posts:
+            return '<div class="platform-content active" data-platform="bluesky"><p>No Bluesky content generated.</p></div>'
+
+        # One pass: char totals accumulate alongside rendering instead of a
+        # second sweep, and the dead joined copy-all string is gone.
+        n = len(posts)
+        total_chars = 0
+        thread_html = []
+        append = thread_html.append
+        for i, post_text in enumerate(posts, 1):
+            escaped = _escape(post_text)
+            char_count = len(post_text)
+            total_chars += char_count
+            append(f"""
+                <div class="thread-post">
+                    <div class="thread-number">Post {i}/{n}</div>
+                    <div id="bs_{post_id}_{i}" class="content-text">{escaped}</div>
+                    <div class="content-footer">
+                        <span class="word-count">{char_count} chars</span>
+                        <button class="copy-button" onclick="copyToClipboard('bs_{post_id}_{i}', this)">
+                            <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><use href="#icon-copy"/></svg>
+                            Copy
+                        </button>
+                    </div>
+                </div>
+            """)
+
+        return f"""
+            <div class="platform-content active" data-platform="bluesky">
+                <div class="thread-container">
+                    {"".join(thread_html)}
+                </div>
+                <div class="content-footer thread-footer">
+                    <span class="word-count">Thread: {n} posts, {total_chars} total chars</span>
+                    <button class="copy-button" onclick="copyThread('{post_id}', {n}, this)">
+                        <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><use href="#icon-copy"/></svg>
+                        Copy All
+                    </button>
+                </div>
+            </div>
+        """
+
+    def _render_linkedin(self, content: str, post_id: str) -> str:
+        """Render LinkedIn post content."""
+        if not content:
+            return '<div class="platform-content" data-platform="linkedin"><p>No LinkedIn content generated.</p></div>'
+
+        # Escape and wrap the paragraphs in one pass: a single join over the
+        # escaped parts instead of per-paragraph f-string concatenation.
+        parts = [_escape(p) for p in content.split("\n\n") if p.strip()]
+        formatted = f"<p>{'</p><p>'.join(parts)}</p>" if parts else ""
+
+        word_count = len(content.split())
+
+        return f"""
+            <div class="platform-content" data-platform="linkedin">
+                <div id="li_{post_id}" class="content-text">
+                    {formatted}
+                </div>
+                <div class="content-footer">
+                    <span class="word-count">{word_count} words</span>
+                    <button class="copy-button" onclick="copyToClipboard('li_{post_id}', this)">
+                        <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><use href="#icon-copy"/></svg>
+                        Copy
+                    </button>
+                </div>
+            </div>
+        """
+
+    def _render_blog(
+        self, title: str, content: str, meta: str, post_id: str
+    ) -> str:
+        """Render blog post content with markdown-style formatting."""
+        if not content:
+            return '<div class="platform-content" data-platform="blog"><p>No blog content generated.</p></div>'
+
+        # Convert markdown-style headers and formatting; the word count
+        # comes from the same pass. Escape the title once - it appears in
+        # both the display header and the metadata.
+        formatted, word_count = self._markdown_to_html(content)
+        escaped_title = _escape(title)
+        escaped_meta = _escape(meta)
+
+        return f"""
+            <div class="platform-content" data-platform="blog">
+                <div class="blog-title-display">{escaped_title}</div>
+                <div id="blog_{post_id}" class="blog-content">
+                    {formatted}
+                </div>
+                <div class="blog-meta">
+                    <div class="blog-meta-title">Post Metadata</div>
+                    <dl>
+                        <dt>Title</dt>
+                        <dd>{escaped_title}</dd>
+                        <dt>Meta Description</dt>
+                        <dd>{escaped_meta}</dd>
+                        <dt>Word Count</dt>
+                        <dd>{word_count} words</dd>
+                    </dl>
+                </div>
+                <div class="content-footer">
+                    <span class="word-count">{word_count} words</span>
+                    <button class="copy-button" onclick="copyToClipboard('blog_{post_id}', this)">
+                        <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><use href="#icon-copy"/></svg>
+                        Copy
+                    </button>
+                </div>
+            </div>
+        """
+
+    def _markdown_to_html(self, text: str) -> "tuple[str, int]":
+        """Convert basic markdown to HTML.
+
+        Returns ``(html, word_count)`` so the blog renderer gets the word
+        total from the same pass instead of re-tokenizing the content.
+        """
+        # Fast path: plain paragraphs need only escape+wrap, no state machine.
+        if not _MD_MARKERS_RE.search(text):
+            formatted = "\n".join(
+                f"<p>{_escape(stripped)}</p>"
+                for stripped in map(str.strip, text.split("\n"))
+                if stripped
+            )
+            return formatted, len(text.split())
+
+        result = []
+        # Bound locals keep the per-line loop free of attribute lookups, and
+        # extend emits close+open tag pairs in one call instead of two.
+        append = result.append
+        extend = result.extend
+        in_list = False
+        list_type = None
+
+        word_count = 0
+        for line in text.split("\n"):
+            stripped = line.strip()
+            word_count += len(stripped.split())
+            block = _MD_BLOCK_RE.match(stripped) if stripped else None
+
+            # Headers and list items: one regex match classifies the marker
+            # and captures the body, replacing the startswith chain and the
+            # per-branch prefix slicing.
+            if block is not None:
+                marker, rest = block.groups()
+                first = marker[0]
+                if first == "#":
+                    if in_list:
+                        append(f"</{list_type}>")
+                        in_list = False
+                    tag = "h2" if len(marker) == 3 else "h3"
+                    append(f"<{tag}>{_escape(rest)}</{tag}>")
+                else:
+                    new_type = "ol" if first.isdigit() else "ul"
+                    if not in_list or list_type != new_type:
+                        if in_list:
+                            extend((f"</{list_type}>", f"<{new_type}>"))
+                        else:
+                            append(f"<{new_type}>")
+                        in_list = True
+                        list_type = new_type
+                    append(f"<li>{_escape(rest)}</li>")
+            # Paragraphs
+            elif stripped:
+                if in_list:
+                    append(f"</{list_type}>")
+                    in_list = False
+                # Handle bold and inline code in one pass
+                escaped = _MD_INLINE_RE.sub(_md_inline_repl, _escape(stripped))
+                append(f"<p>{escaped}</p>")
+
+        if in_list:
+            append(f"</{list_type}>")
+
+        return "\n".join(result), word_count
+
+    def _render_source_link(self, post: SocialPost) -> str:
+        """Render source link if available."""
+        if post.source_articles:
+            first_article = post.source_articles[0]
+            link = first_article.get("link") or first_article.get("url")
+            if link:
+                return f' &bull; <a href="{_escape(link)}" target="_blank" rel="noopener">View Source</a>'
+        return ""
+
+    def _get_css(self) -> str:
+        """Return the CSS styles (dark theme matching benchmarking_deepdive)."""
+        return _CSS_STYLES
+
+    def _get_javascript(self) -> str:
+        """Return the JavaScript for tab switching and copy functionality."""
+        return _JS_CODE
+
+    def _save_html(self, segments: Iterable[str], filename: str = None, now: datetime = None) -> str:
+        """Stream HTML segments into the output directory."""
         OUTPUT_DIR.mkdir(exist_ok=True)
 
         if not filename:
-            filename = f"social_content_{datetime.now().strftime('%Y%m%d')}.html"
+            filename = f"social_content_{(now or datetime.now()).strftime(_FILE_FMT)}.html"
 
         filepath = OUTPUT_DIR / filename
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(html_doc)
+        # Write behind a 256 KiB buffer (the default resolves to the 4 KiB
+        # block size) and publish atomically so readers never see a partial
+        # document. A .gz filename compresses the stream as it is written -
+        # the repetitive card markup compresses 5-10x.
+        tmp_path = filepath.with_suffix(filepath.suffix + ".tmp")
+        if filename.endswith(".gz"):
+            writer = gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=6)
+        else:
+            writer = open(tmp_path, "w", encoding="utf-8", buffering=1 << 18)
+        with writer as f:
+            f.writelines(segments)
+        os.replace(tmp_path, filepath)
 
         print(f"📱 Social content HTML saved to {filepath}")
         return str(filepath)
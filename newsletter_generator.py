@@ -1,4 +1,9 @@
+import hashlib
+import heapq
 import json
+from html import escape
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 import os
@@ -12,154 +17,22 @@ from bluesky_generator import BlueskyPostGenerator
 from social_content_generator import SocialContentGenerator
 from html_generator import HTMLGenerator
 
-class NewsletterGenerator:
-    def __init__(self, anthropic_api_key: str = None):
-        self.rss_scraper = RSSNewsScraper()
-        self.reddit_scraper = RedditScraper()
-        self.community_aggregator = CommunityAggregator()
-        self.trend_analyzer = TrendAnalyzer()
-        self.summarizer = AISummarizer(anthropic_api_key)
-        self.bluesky_generator = BlueskyPostGenerator(self.summarizer)
-        self.social_content_generator = SocialContentGenerator(self.summarizer)
-        self.html_generator = HTMLGenerator()
-        
-    def collect_all_data(self, days_back: int = 7) -> tuple:
-        """Collect data from all sources"""
-        print("🔄 Starting data collection for newsletter...\n")
-        
-        # Scrape RSS feeds
-        rss_articles = self.rss_scraper.scrape_all_sources(days_back)
-        
-        # Scrape Reddit
-        reddit_posts = self.reddit_scraper.scrape_all_subreddits('week')
-
-        # Layer additional community signals (Hacker News, Techmeme, etc.)
-        additional_posts = self.community_aggregator.gather(days_back)
-        community_posts = reddit_posts + additional_posts
-        
-        # Combine and analyze trends
-        all_content = rss_articles + community_posts
-        trend_report = self.trend_analyzer.generate_trend_report(all_content)
-        
-        return rss_articles, community_posts, trend_report
-    
-    def select_top_stories(self, articles: List[Dict], max_stories: int = 5) -> List[Dict]:
-        """Select the most important stories from respected sources"""
-        # Score articles based on recency, source credibility, and keywords
-        scored_articles = []
-        
-        for article in articles:
-            score = 0
-            
-            # Recency bonus (newer = higher score)
-            if article.get('published'):
-                try:
-                    pub_date = datetime.fromisoformat(article['published'].replace('Z', '+00:00'))
-                    days_old = (datetime.now() - pub_date.replace(tzinfo=None)).days
-                    score += max(7 - days_old, 0)  # Up to 7 points for recency
-                except:
-                    score += 1  # Minimal score if date parsing fails
-            
-            # Source credibility (some sources weighted higher)
-            premium_sources = ['Nature Computational Biology', 'Science Magazine', 'Cell Press', 'MIT AI News', 'PLOS Computational Biology']
-            if article.get('source') in premium_sources:
-                score += 3
-            
-            # Keyword relevance
-            keywords = article.get('keywords', [])
-            high_value_keywords = ['protein folding', 'drug discovery', 'alphafold', 'crispr', 'genomics', 'breakthrough', 'research', 'clinical']
-            score += len([k for k in keywords if k in high_value_keywords]) * 2
-            
-            scored_articles.append((score, article))
-        
-        # Sort by score and return top stories
-        scored_articles.sort(key=lambda x: x[0], reverse=True)
-        return [article for _, article in scored_articles[:max_stories]]
-    
-    def select_community_highlights(self, posts: List[Dict], max_posts: int = 5) -> List[Dict]:
-        """Select the most engaging community posts"""
-        # Filter and score posts
-        scored_posts = []
-        
-        for post in posts:
-            score = post.get('score', 0) + (post.get('num_comments', 0) * 2)
-            
-            # Bonus for positive sentiment
-            if post.get('sentiment') == 'very_positive':
-                score *= 1.5
-            elif post.get('sentiment') == 'positive':
-                score *= 1.2
-            
-            # Bonus for multiple keywords (broader relevance)
-            keywords = post.get('keywords', [])
-            if len(keywords) >= 3:
-                score *= 1.3
-            
-            scored_posts.append((score, post))
-        
-        # Sort by score and return top posts
-        scored_posts.sort(key=lambda x: x[0], reverse=True)
-        return [post for _, post in scored_posts[:max_posts]]
-    
-    def generate_top_three_summary(self, top_stories: List[Dict], community_highlights: List[Dict], top_trends: List[Dict]) -> str:
-        """Generate a brief bullet point summary of the top three overall stories"""
-        # Take the first item from each category for the top 3
-        top_three = []
-
-        if top_stories:
-            top_three.append({
-                'title': top_stories[0].get('title', 'Untitled'),
-                'type': 'Research',
-                'link': top_stories[0].get('link', '#')
-            })
-
-        if community_highlights:
-            top_three.append({
-                'title': community_highlights[0].get('title', 'Untitled'),
-                'type': 'Community',
-                'link': community_highlights[0].get('url') or community_highlights[0].get('link', '#')
-            })
-
-        if top_trends:
-            top_three.append({
-                'title': top_trends[0].get('keyword', 'Trending Topic'),
-                'type': 'Trending',
-                'link': None
-            })
-
-        # Generate HTML for top three summary
-        summary_html = ""
-        for item in top_three[:3]:
-            if item.get('link'):
-                summary_html += f"• <strong>{item['type']}:</strong> <a href=\"{item['link']}\" target=\"_blank\">{item['title']}</a><br>\n"
-            else:
-                summary_html += f"• <strong>{item['type']}:</strong> {item['title']}<br>\n"
-
-        return summary_html
-
-    def generate_html_newsletter(self, articles: List[Dict], posts: List[Dict], trend_report: Dict) -> str:
-        """Generate HTML newsletter"""
-        
-        # Get current date for header
-        current_date = datetime.now().strftime("%B %d, %Y")
-        week_start = (datetime.now() - timedelta(days=7)).strftime("%B %d")
-        date_range = f"{week_start} - {datetime.now().strftime('%B %d, %Y')}"
-        
-        trends = (trend_report or {}).get('trending_topics', [])
-        overview_summary = (trend_report or {}).get('overview_summary')
-        # Select top content
-        top_stories = self.select_top_stories(articles, 3)
-        community_highlights = self.select_community_highlights(posts, 3)
-        top_trends = trends[:3]
-        
-        html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>BioAI Weekly: Research & Community - {current_date}</title>
-    <style>
-        body {{
+# Scoring sets hoisted out of _score_article: frozenset membership and
+# intersection beat rebuilding list literals for every article scored.
+_PREMIUM_SOURCES = frozenset({
+    'Nature Computational Biology', 'Science Magazine', 'Cell Press',
+    'MIT AI News', 'PLOS Computational Biology',
+})
+_HIGH_VALUE_KEYWORDS = frozenset({
+    'protein folding', 'drug discovery', 'alphafold', 'crispr',
+    'genomics', 'breakthrough', 'research', 'clinical',
+})
+
+# Stylesheet for the email newsletter. Hoisted out of the f-string so the
+# ~6 KB of CSS is not re-scanned for replacement fields (and its braces no
+# longer need doubling) on every render.
+_NEWSLETTER_CSS = """\
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
             line-height: 1.6;
             color: #333;
@@ -167,139 +40,139 @@ class NewsletterGenerator:
             margin: 0 auto;
             padding: 20px;
             background-color: #f8f9fa;
-        }}
-        .newsletter-container {{
+        }
+        .newsletter-container {
             background: white;
             padding: 40px;
             border-radius: 8px;
             box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-        .header {{
+        }
+        .header {
             text-align: center;
             border-bottom: 3px solid #007acc;
             padding-bottom: 20px;
             margin-bottom: 30px;
-        }}
-        .newsletter-title {{
+        }
+        .newsletter-title {
             font-size: 2.5em;
             font-weight: bold;
             color: #007acc;
             margin: 0;
-        }}
-        .newsletter-subtitle {{
+        }
+        .newsletter-subtitle {
             font-size: 1.1em;
             color: #666;
             margin: 5px 0 0 0;
-        }}
-        .date {{
+        }
+        .date {
             color: #888;
             font-size: 0.9em;
             margin-top: 10px;
-        }}
-        .overview-intro {{
+        }
+        .overview-intro {
             margin: 25px 0;
             padding: 18px 20px;
             background: #eef6ff;
             border-left: 4px solid #007acc;
             border-radius: 6px;
             font-size: 1.05em;
-        }}
-        .section {{
+        }
+        .section {
             margin: 40px 0;
-        }}
-        .section-title {{
+        }
+        .section-title {
             font-size: 1.8em;
             font-weight: bold;
             margin-bottom: 15px;
             color: #2c3e50;
-        }}
-        .section-intro {{
+        }
+        .section-intro {
             font-style: italic;
             color: #555;
             margin-bottom: 25px;
             font-size: 1.05em;
-        }}
-        .story {{
+        }
+        .story {
             margin-bottom: 30px;
             padding: 20px;
             background: #f8f9fa;
             border-radius: 6px;
             border-left: 4px solid #007acc;
-        }}
-        .story-title {{
+        }
+        .story-title {
             font-size: 1.3em;
             font-weight: bold;
             margin-bottom: 8px;
             color: #2c3e50;
-        }}
-        .story-title a {{
+        }
+        .story-title a {
             color: #2c3e50;
             text-decoration: none;
-        }}
-        .story-title a:hover {{
+        }
+        .story-title a:hover {
             color: #007acc;
-        }}
-        .story-source {{
+        }
+        .story-source {
             font-size: 0.85em;
             color: #007acc;
             font-weight: 500;
             margin-bottom: 10px;
-        }}
-        .story-content {{
+        }
+        .story-content {
             font-size: 1em;
             line-height: 1.7;
-        }}
-        .trend-item {{
+        }
+        .trend-item {
             margin-bottom: 20px;
             padding: 15px;
             background: #fff3cd;
             border-radius: 6px;
             border-left: 4px solid #ffc107;
-        }}
-        .trend-keyword {{
+        }
+        .trend-keyword {
             font-weight: bold;
             color: #856404;
             font-size: 1.1em;
-        }}
-        .trend-details {{
+        }
+        .trend-details {
             font-size: 0.9em;
             color: #666;
             margin-top: 5px;
-        }}
-        .community-post {{
+        }
+        .community-post {
             margin-bottom: 25px;
             padding: 18px;
             background: #e8f5e8;
             border-radius: 6px;
             border-left: 4px solid #28a745;
-        }}
-        .post-title {{
+        }
+        .post-title {
             font-size: 1.2em;
             font-weight: bold;
             margin-bottom: 8px;
             color: #2c3e50;
-        }}
-        .post-title a {{
+        }
+        .post-title a {
             color: #2c3e50;
             text-decoration: none;
-        }}
-        .post-title a:hover {{
+        }
+        .post-title a:hover {
             color: #28a745;
-        }}
-        .post-meta {{
+        }
+        .post-meta {
             font-size: 0.85em;
             color: #28a745;
             margin-bottom: 10px;
-        }}
-        .footer {{
+        }
+        .footer {
             margin-top: 50px;
             padding-top: 20px;
             border-top: 1px solid #ddd;
             text-align: center;
             color: #888;
             font-size: 0.9em;
-        }}
-        .citations {{
+        }
+        .citations {
             margin-top: 15px;
             font-size: 0.85em;
             color: #666;
@@ -308,46 +181,260 @@ class NewsletterGenerator:
             background: #f9f9f9;
             border-radius: 4px;
             padding: 10px;
-        }}
-        .citations strong {{
+        }
+        .citations strong {
             color: #444;
             font-size: 0.9em;
-        }}
-        .citations a {{
+        }
+        .citations a {
             color: #007acc;
             text-decoration: none;
-        }}
-        .citations a:hover {{
+        }
+        .citations a:hover {
             text-decoration: underline;
-        }}
-        .stats {{
+        }
+        .stats {
             background: #e9ecef;
             padding: 15px;
             border-radius: 6px;
             margin: 20px 0;
             text-align: center;
-        }}
-        .top-three {{
+        }
+        .top-three {
             margin: 25px 0;
             padding: 20px;
             background: #fff8e1;
             border-left: 4px solid #ff9800;
             border-radius: 6px;
             font-size: 1.05em;
-        }}
-        .top-three h3 {{
+        }
+        .top-three h3 {
             margin: 0 0 15px 0;
             color: #e65100;
             font-size: 1.3em;
-        }}
-        .top-three a {{
+        }
+        .top-three a {
             color: #007acc;
             text-decoration: none;
-        }}
-        .top-three a:hover {{
+        }
+        .top-three a:hover {
             text-decoration: underline;
-        }}
-    </style>
+        }
+"""
+
+class NewsletterGenerator:
+    def __init__(self, anthropic_api_key: str = None):
+        self.rss_scraper = RSSNewsScraper()
+        self.reddit_scraper = RedditScraper()
+        self.community_aggregator = CommunityAggregator()
+        self.trend_analyzer = TrendAnalyzer()
+        self.summarizer = AISummarizer(anthropic_api_key)
+        self.bluesky_generator = BlueskyPostGenerator(self.summarizer)
+        self.social_content_generator = SocialContentGenerator(self.summarizer)
+        self.html_generator = HTMLGenerator()
+        # LLM calls dominate wall clock; memoize them per run so a story
+        # that appears in several sections (top three, research, community)
+        # is only summarized once.
+        self._story_summary_cache = {}
+        self._cluster_summary_cache = {}
+
+    @staticmethod
+    def _story_cache_key(story: Dict, context: str) -> str:
+        raw = f"{story.get('title', '')}|{story.get('link') or story.get('url') or ''}|{context}"
+        return hashlib.blake2b(raw.encode('utf-8'), digest_size=16).hexdigest()
+
+    def _summarize_story_cached(self, story: Dict, context: str) -> tuple:
+        key = self._story_cache_key(story, context)
+        if key not in self._story_summary_cache:
+            self._story_summary_cache[key] = self.summarizer.summarize_individual_story(
+                story, context=context
+            )
+        return self._story_summary_cache[key]
+
+    def _prime_story_cache(self, stories: List[Dict], context: str) -> None:
+        """Batch-summarize uncached stories so render loops hit the cache."""
+        missing = [
+            story for story in stories
+            if self._story_cache_key(story, context) not in self._story_summary_cache
+        ]
+        if len(missing) < 2:
+            return  # A single story costs the same either way.
+        results = self.summarizer.summarize_many(missing, context=context)
+        for story, result in zip(missing, results):
+            self._story_summary_cache[self._story_cache_key(story, context)] = result
+
+    def _summarize_cluster_cached(self, keyword: str, articles: List[Dict], style: str) -> tuple:
+        links = tuple(sorted(a.get('link') or a.get('url') or a.get('title', '') for a in articles))
+        key = (keyword, links, style)
+        if key not in self._cluster_summary_cache:
+            self._cluster_summary_cache[key] = self.summarizer.summarize_topic_cluster(
+                keyword, articles, style=style
+            )
+        return self._cluster_summary_cache[key]
+        
+    def collect_all_data(self, days_back: int = 7) -> tuple:
+        """Collect data from all sources"""
+        print("🔄 Starting data collection for newsletter...\n")
+
+        # The three collectors hit independent endpoints, so run them
+        # concurrently; each releases the GIL while waiting on sockets.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            rss_future = executor.submit(self.rss_scraper.scrape_all_sources, days_back)
+            reddit_future = executor.submit(self.reddit_scraper.scrape_all_subreddits, 'week')
+            community_future = executor.submit(self.community_aggregator.gather, days_back)
+            rss_articles = rss_future.result()
+            reddit_posts = reddit_future.result()
+            additional_posts = community_future.result()
+
+        # Parse each article's published date exactly once; scoring used to
+        # re-parse the ISO string on every pass over the list.
+        for article in rss_articles:
+            if article.get('_pub_ts'):
+                continue  # RSS scraper already recorded the epoch.
+            published = article.get('published')
+            if published:
+                try:
+                    article['_pub_ts'] = datetime.fromisoformat(
+                        published.replace('Z', '+00:00')
+                    ).timestamp()
+                except (TypeError, ValueError):
+                    pass
+
+        # Extend in place rather than building fresh lists with ``+``; the
+        # collector results are local, so nothing else holds a reference.
+        community_posts = reddit_posts
+        community_posts.extend(additional_posts)
+
+        # Combine and analyze trends
+        all_content = [*rss_articles, *community_posts]
+        trend_report = self.trend_analyzer.generate_trend_report(all_content)
+        
+        return rss_articles, community_posts, trend_report
+    
+    @staticmethod
+    def _score_article(article: Dict, now_ts: float = None) -> int:
+        """Score an article by recency, source credibility, and keywords."""
+        score = 0
+        if now_ts is None:
+            now_ts = datetime.now().timestamp()
+
+        # Recency bonus (newer = higher score)
+        pub_ts = article.get('_pub_ts')
+        if pub_ts is not None:
+            days_old = int((now_ts - pub_ts) // 86400)
+            score += max(7 - days_old, 0)  # Up to 7 points for recency
+        elif article.get('published'):
+            score += 1  # Minimal score if date parsing failed upstream
+
+        # Source credibility (some sources weighted higher)
+        if article.get('source') in _PREMIUM_SOURCES:
+            score += 3
+
+        # Keyword relevance
+        score += len(_HIGH_VALUE_KEYWORDS.intersection(article.get('keywords', []))) * 2
+
+        return score
+
+    @staticmethod
+    def _score_post(post: Dict) -> float:
+        """Score a community post by engagement, sentiment, and breadth."""
+        score = post.get('score', 0) + (post.get('num_comments', 0) * 2)
+
+        # Bonus for positive sentiment
+        if post.get('sentiment') == 'very_positive':
+            score *= 1.5
+        elif post.get('sentiment') == 'positive':
+            score *= 1.2
+
+        # Bonus for multiple keywords (broader relevance)
+        keywords = post.get('keywords', [])
+        if len(keywords) >= 3:
+            score *= 1.3
+
+        return score
+
+    def select_top_stories(self, articles: List[Dict], max_stories: int = 5) -> List[Dict]:
+        """Select the most important stories from respected sources"""
+        # A bounded heap selects the top handful in O(n log k) without
+        # sorting (or materializing score tuples for) the full list.
+        now_ts = datetime.now().timestamp()
+        return heapq.nlargest(
+            max_stories, articles, key=lambda a: self._score_article(a, now_ts)
+        )
+
+    def select_community_highlights(self, posts: List[Dict], max_posts: int = 5) -> List[Dict]:
+        """Select the most engaging community posts"""
+        return heapq.nlargest(max_posts, posts, key=self._score_post)
+    
+    def generate_top_three_summary(self, top_stories: List[Dict], community_highlights: List[Dict], top_trends: List[Dict]) -> str:
+        """Generate a brief bullet point summary of the top three overall stories"""
+        # Take the first item from each category for the top 3
+        top_three = []
+
+        if top_stories:
+            top_three.append({
+                'title': top_stories[0].get('title', 'Untitled'),
+                'type': 'Research',
+                'link': top_stories[0].get('link', '#')
+            })
+
+        if community_highlights:
+            top_three.append({
+                'title': community_highlights[0].get('title', 'Untitled'),
+                'type': 'Community',
+                'link': community_highlights[0].get('url') or community_highlights[0].get('link', '#')
+            })
+
+        if top_trends:
+            top_three.append({
+                'title': top_trends[0].get('keyword', 'Trending Topic'),
+                'type': 'Trending',
+                'link': None
+            })
+
+        # Generate HTML for top three summary
+        summary_html = ""
+        for item in top_three[:3]:
+            title = escape(item['title'])
+            if item.get('link'):
+                summary_html += f"• <strong>{item['type']}:</strong> <a href=\"{escape(item['link'])}\" target=\"_blank\">{title}</a><br>\n"
+            else:
+                summary_html += f"• <strong>{item['type']}:</strong> {title}<br>\n"
+
+        return summary_html
+
+    def generate_html_newsletter(self, articles: List[Dict], posts: List[Dict], trend_report: Dict) -> str:
+        """Generate HTML newsletter"""
+        
+        # Get current date for header; one clock read keeps the header,
+        # range, and footer on the same day even across a midnight render.
+        now = datetime.now()
+        current_date = now.strftime("%B %d, %Y")
+        week_start = (now - timedelta(days=7)).strftime("%B %d")
+        date_range = f"{week_start} - {current_date}"
+        
+        trends = (trend_report or {}).get('trending_topics', [])
+        overview_summary = (trend_report or {}).get('overview_summary')
+        # Select top content
+        top_stories = self.select_top_stories(articles, 3)
+        community_highlights = self.select_community_highlights(posts, 3)
+        top_trends = trends[:3]
+
+        # One batched request per section instead of an API round trip per
+        # story; the render loops below read the primed cache.
+        self._prime_story_cache(top_stories, "respected")
+        self._prime_story_cache(community_highlights, "community")
+        
+        # Accumulate segments and join once at the end; repeated ``+=`` on a
+        # growing string re-copies the whole document for every section.
+        parts = [f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>BioAI Weekly: Research & Community - {current_date}</title>
+    <style>
+""", _NEWSLETTER_CSS, f"""    </style>
 </head>
 <body>
     <div class="newsletter-container">
@@ -360,87 +447,89 @@ class NewsletterGenerator:
         <div class="stats">
             📊 This week: {len(articles)} articles analyzed • {len(posts)} community posts • {len(trends)} trending topics
         </div>
-"""
+"""]
 
         # Generate and add top three summary
         top_three_summary_html = self.generate_top_three_summary(top_stories, community_highlights, top_trends)
         if top_three_summary_html:
-            html += f"""
+            parts.append(f"""
         <div class="top-three">
             <h3>⭐ Top Three Stories This Week</h3>
             {top_three_summary_html}
         </div>
-"""
+""")
 
         if overview_summary:
-            html += f"""
+            parts.append(f"""
         <div class="overview-intro">
             {overview_summary}
         </div>
-"""
+""")
 
         # The Signal Section
         if top_stories:
             signal_intro = self.summarizer.generate_section_intro("The Signal", len(top_stories))
-            html += f"""
+            parts.append(f"""
         <div class="section">
             <h2 class="section-title">🔬 Research Frontiers</h2>
             <p class="section-intro">{signal_intro}</p>
-"""
+""")
             
             for story in top_stories:
-                title = story.get('title', 'Untitled')
-                source = story.get('source', 'Unknown Source')
-                link = story.get('link', '#')
+                # Titles and sources arrive from scraped feeds; escape them
+                # before they land in markup.
+                title = escape(story.get('title', 'Untitled'))
+                source = escape(story.get('source', 'Unknown Source'))
+                link = escape(story.get('link', '#'))
                 
                 # Generate AI summary
-                summary, _ = self.summarizer.summarize_individual_story(story, context="respected")
+                summary, _ = self._summarize_story_cached(story, "respected")
                 
-                html += f"""
+                parts.append(f"""
             <div class="story">
                 <div class="story-source">{source}</div>
                 <h3 class="story-title"><a href="{link}" target="_blank">{title}</a></h3>
                 <div class="story-content">{summary}</div>
             </div>
-"""
-            html += "        </div>"
+""")
+            parts.append("        </div>")
 
         # The Noise Section
         if community_highlights:
             noise_intro = self.summarizer.generate_section_intro("The Noise", len(community_highlights))
-            html += f"""
+            parts.append(f"""
         <div class="section">
             <h2 class="section-title">🧬 Community Insights</h2>
             <p class="section-intro">{noise_intro}</p>
-"""
+""")
             
             for post in community_highlights:
-                title = post.get('title', 'Untitled')
-                subreddit = post.get('subreddit') or post.get('source', 'Community')
-                url = post.get('url') or post.get('link', '#')
+                title = escape(post.get('title', 'Untitled'))
+                subreddit = escape(post.get('subreddit') or post.get('source', 'Community'))
+                url = escape(post.get('url') or post.get('link', '#'))
                 score = post.get('score', 0)
                 comments = post.get('num_comments', 0)
                 
                 # Generate community-focused summary
-                summary, _ = self.summarizer.summarize_individual_story(post, context="community")
+                summary, _ = self._summarize_story_cached(post, "community")
                 
-                html += f"""
+                parts.append(f"""
             <div class="community-post">
                 <div class="post-meta">{subreddit} • {score} upvotes • {comments} comments</div>
                 <h3 class="post-title"><a href="{url}" target="_blank">{title}</a></h3>
                 <div class="story-content">{summary}</div>
             </div>
-"""
-            html += "        </div>"
+""")
+            parts.append("        </div>")
 
         # Trending This Week Section
         if top_trends:
             trending_intro = self.summarizer.generate_section_intro("Trending This Week", len(top_trends))
-            html += f"""
+            parts.append(f"""
         <div class="section">
             <h2 class="section-title">📈 Trending This Week</h2>
             <p class="section-intro">{trending_intro}</p>
-"""
+""")
             
             for trend in top_trends:
                 keyword = trend.get('keyword', '')
@@ -449,9 +538,25 @@ class NewsletterGenerator:
                 respected_count = len(trend.get('respected_sources', []))
                 community_count = len(trend.get('community_posts', []))
                 
-                # Create trend summary with citations
-                trend_articles = trend.get('respected_sources', []) + trend.get('community_posts', [])
-                trend_summary, citations, qa_flags = self.summarizer.summarize_topic_cluster(keyword, trend_articles, style='professional')
+                # Create trend summary with citations. Sources and posts can
+                # overlap between clusters, so dedup by link before handing
+                # the set to the LLM, and cap oversized clusters at the eight
+                # most-engaged items to bound prompt size.
+                trend_articles = []
+                seen_links = set()
+                for item in chain(trend.get('respected_sources', []), trend.get('community_posts', [])):
+                    item_link = item.get('link') or item.get('url')
+                    if item_link:
+                        if item_link in seen_links:
+                            continue
+                        seen_links.add(item_link)
+                    trend_articles.append(item)
+                if len(trend_articles) > 8:
+                    trend_articles = heapq.nlargest(
+                        8, trend_articles,
+                        key=lambda i: i.get('score', 0) + i.get('num_comments', 0) * 2,
+                    )
+                trend_summary, citations, qa_flags = self._summarize_cluster_cached(keyword, trend_articles, 'professional')
                 if qa_flags:
                     print(f"⚠️  QA review suggested for trend '{keyword}': {', '.join(qa_flags)}")
 
@@ -465,31 +570,31 @@ class NewsletterGenerator:
                 # Format citations for HTML
                 citations_html = ""
                 if citations:
-                    citations_html = "<div class='citations'>"
-                    citations_html += "<strong>Sources:</strong><br>"
+                    citation_parts = ["<div class='citations'>", "<strong>Sources:</strong><br>"]
                     for citation in citations:
-                        # Parse citation to make link clickable
+                        # Parse citation to make link clickable. The link is
+                        # appended last by the summarizer, so split on the
+                        # final " - http" in case the title itself quotes a URL.
                         if " - http" in citation:
-                            parts = citation.split(" - http")
-                            text_part = parts[0]
-                            url_part = "http" + parts[1]
-                            citations_html += f"{text_part} - <a href='{url_part}' target='_blank'>Link</a><br>"
+                            text_part, _, url_tail = citation.rpartition(" - http")
+                            citation_parts.append(f"{escape(text_part)} - <a href='http{escape(url_tail)}' target='_blank'>Link</a><br>")
                         else:
-                            citations_html += f"{citation}<br>"
-                    citations_html += "</div>"
+                            citation_parts.append(f"{escape(citation)}<br>")
+                    citation_parts.append("</div>")
+                    citations_html = "".join(citation_parts)
 
-                html += f"""
+                parts.append(f"""
             <div class="trend-item">
-                <div class="trend-keyword">#{keyword.replace(' ', '').title()}</div>
+                <div class="trend-keyword">#{escape(keyword.replace(' ', '').title())}</div>
                 <div class="trend-details">{mentions} mentions • {respected_count} news sources • {community_count} community posts • Community sentiment: {sentiment_emoji}</div>
                 <div class="story-content" style="margin-top: 10px;">{trend_summary}</div>
                 {citations_html}
             </div>
-"""
-            html += "        </div>"
+""")
+            parts.append("        </div>")
 
         # Footer
-        html += f"""
+        parts.append(f"""
         <div class="footer">
             <p>Generated on {current_date}</p>
             <p>This newsletter aggregates AI news from trusted sources and community discussions.<br>
@@ -498,14 +603,14 @@ class NewsletterGenerator:
         </div>
     </div>
 </body>
-</html>"""
+</html>""")
 
-        return html
+        return "".join(parts)
     
-    def save_newsletter(self, html_content: str, filename: str = None) -> str:
+    def save_newsletter(self, html_content: str, filename: str = None, now: datetime = None) -> str:
         """Save newsletter HTML to file"""
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d")
+            timestamp = (now or datetime.now()).strftime("%Y%m%d")
             filename = f"ai_weekly_{timestamp}.html"
 
         # Use output directory in project folder
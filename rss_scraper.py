@@ -1,6 +1,11 @@
+import calendar
 import feedparser
+import operator
 import requests
 import os
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 import json
@@ -8,7 +13,43 @@ import time
 from urllib.parse import urlparse
 import re
 
-from bio_ai_topic_filter import TopicMatch, analyze_text_for_bio_ai
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+from bio_ai_topic_filter import TopicMatch, analyze_text_for_bio_ai, has_bio_ai_hints
+
+# Whitespace pattern compiled once at import; also folds non-breaking spaces.
+_WS_RE = re.compile(r'[\s\u00a0]+')
+
+# Single C pass that maps the common whitespace variants to plain spaces;
+# the regex above only runs when runs of spaces are left to collapse.
+_WS_TABLE = str.maketrans({
+    '\t': ' ', '\n': ' ', '\r': ' ', '\v': ' ', '\f': ' ', '\u00a0': ' ',
+})
+
+
+def _strip_tags(text: str) -> str:
+    """Drop ``<...>`` spans with an incremental ``str.find`` scan.
+
+    Multi-kilobyte summaries are common, and the C-level find/slice loop
+    stays linear in the input with no regex state machine; an unclosed
+    trailing ``<`` discards the remainder, matching tag-stripping intent.
+    """
+    out = []
+    i = 0
+    while True:
+        j = text.find('<', i)
+        if j < 0:
+            out.append(text[i:])
+            break
+        out.append(text[i:j])
+        k = text.find('>', j)
+        if k < 0:
+            break
+        i = k + 1
+    return ''.join(out)
 
 class RSSNewsScraper:
     def __init__(self):
@@ -57,54 +98,133 @@ class RSSNewsScraper:
             'MarkTechPost': 'https://www.marktechpost.com/feed/',
             'Towards Data Science': 'https://towardsdatascience.com/feed'
         }
-        
+        # Shared session pools TLS connections across the worker threads.
+        self._session = requests.Session()
+        self._session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+            'Accept-Encoding': 'gzip, deflate',
+        })
+        # One lock per host serializes requests to the same server while
+        # different hosts are fetched concurrently.
+        self._host_locks = defaultdict(threading.Lock)
+        # Conditional-GET state (ETag/Last-Modified plus the last parsed
+        # articles) persisted between runs; most feeds are unchanged
+        # week-over-week and answer 304, skipping download and parse.
+        self._feed_state_path = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), "output", "feed_state.json"
+        )
+        self._feed_state = self._load_feed_state()
+        self._state_lock = threading.Lock()
+
+    def _load_feed_state(self) -> Dict:
+        try:
+            with open(self._feed_state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_feed_state(self) -> None:
+        os.makedirs(os.path.dirname(self._feed_state_path), exist_ok=True)
+        tmp = self._feed_state_path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self._feed_state, f)
+        os.replace(tmp, self._feed_state_path)
+
     def clean_text(self, text: str) -> str:
         """Clean HTML tags and normalize text"""
         if not text:
             return ""
-        # Remove HTML tags
-        clean = re.sub('<.*?>', '', text)
-        # Normalize whitespace
-        clean = re.sub(r'\s+', ' ', clean)
-        return clean.strip()
+        # Most titles carry no markup at all; skip the tag pass for them.
+        if '<' in text:
+            text = _strip_tags(text)
+        text = text.translate(_WS_TABLE)
+        if '  ' not in text:
+            return text.strip()
+        return _WS_RE.sub(' ', text).strip()
     
     def extract_keywords(self, text: str) -> TopicMatch:
         """Return Bio+AI keyword matches for downstream filtering."""
         return analyze_text_for_bio_ai(text)
     
-    def fetch_feed(self, source_name: str, feed_url: str, days_back: int = 7) -> List[Dict]:
+    def fetch_feed(self, source_name: str, feed_url: str, days_back: int = 7,
+                   cutoff_ts: float = None) -> List[Dict]:
         """Fetch articles from a single RSS feed"""
+        if cutoff_ts is None:
+            cutoff_ts = time.time() - days_back * 86400
         try:
             print(f"Fetching {source_name}...")
-            
-            # Set user agent to avoid blocks
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-            }
-            
-            response = requests.get(feed_url, headers=headers, timeout=10)
-            feed = feedparser.parse(response.content)
+
+            state = self._feed_state.get(feed_url, {})
+            headers = {}
+            if state.get('etag'):
+                headers['If-None-Match'] = state['etag']
+            if state.get('last_modified'):
+                headers['If-Modified-Since'] = state['last_modified']
+
+            # Stay polite per host: hold that host's lock for the request so
+            # concurrent workers never hammer the same server.
+            with self._host_locks[urlparse(feed_url).netloc]:
+                response = self._session.get(feed_url, headers=headers, timeout=10, stream=True)
+
+            if response.status_code == 304:
+                # Feed unchanged since last run: reuse the cached parse,
+                # re-applying the recency window.
+                cutoff_iso = datetime.utcfromtimestamp(cutoff_ts).isoformat()
+                cached = [
+                    a for a in state.get('articles', [])
+                    if not a.get('published') or a['published'] >= cutoff_iso
+                ]
+                for a in cached:
+                    a.setdefault('_pub_ts', 0)
+                print(f"✓ {source_name}: unchanged ({len(cached)} cached articles)")
+                return cached
+
+            # Hand feedparser the decompressed stream instead of snapshotting
+            # the body via .content first; same parse, one less full copy.
+            response.raw.decode_content = True
+            feed = feedparser.parse(response.raw)
             
             articles = []
-            cutoff_date = datetime.now() - timedelta(days=days_back)
-            
+
+            seen_ids = state.get('seen_ids', [])
+            seen_set = set(seen_ids)
+            new_ids = []
+
             for entry in feed.entries[:20]:  # Limit to latest 20 entries per source
-                # Parse publication date
-                pub_date = None
-                if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                    pub_date = datetime(*entry.published_parsed[:6])
-                elif hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-                    pub_date = datetime(*entry.updated_parsed[:6])
-                
+                # Feeds are newest-first; the first already-seen id marks
+                # where the previous run left off, so stop cleaning and
+                # classifying there.
+                eid = entry.get('id') or entry.get('link')
+                if eid:
+                    if eid in seen_set:
+                        break
+                    new_ids.append(eid)
+
+                # Compare epoch floats in the hot path; timegm on the
+                # struct_time is UTC-correct and far cheaper than building a
+                # datetime per entry just to compare it.
+                pub_ts = None
+                parsed = entry.get('published_parsed') or entry.get('updated_parsed')
+                if parsed:
+                    pub_ts = calendar.timegm(parsed)
+
                 # Skip old articles
-                if pub_date and pub_date < cutoff_date:
+                if pub_ts is not None and pub_ts < cutoff_ts:
                     continue
                 
                 title = self.clean_text(entry.get('title', ''))
-                summary = self.clean_text(entry.get('summary', ''))
+                # Bound the raw summary before cleaning: some feeds ship tens
+                # of kilobytes of HTML only for the result to be cut at 500
+                # chars anyway. 2000 raw chars comfortably survive tag
+                # stripping at that length.
+                summary = self.clean_text(entry.get('summary', '')[:2000])
                 
-                # Extract keywords and ensure the story sits at the Bio+AI intersection
-                keyword_match = self.extract_keywords(f"{title} {summary}")
+                # Two-stage relevance check: a substring hint scan discards
+                # the bulk of off-topic entries before the full classifier.
+                full_text = f"{title} {summary}"
+                if not has_bio_ai_hints(full_text.lower()):
+                    continue
+                keyword_match = self.extract_keywords(full_text)
                 if not keyword_match.is_bio_ai:
                     continue
 
@@ -113,14 +233,36 @@ class RSSNewsScraper:
                     'title': title,
                     'link': entry.get('link', ''),
                     'summary': summary[:500] + '...' if len(summary) > 500 else summary,
-                    'published': pub_date.isoformat() if pub_date else None,
+                    'published': datetime.utcfromtimestamp(pub_ts).isoformat() if pub_ts is not None else None,
+                    '_pub_ts': pub_ts or 0,
                     'keywords': keyword_match.keywords,
                     'type': 'respected'
                 }
                 
                 if title:  # Only add articles with titles
                     articles.append(article)
-            
+
+            if seen_set:
+                # Entries past the break point were parsed in a previous run;
+                # carry their cached articles forward through the window.
+                cutoff_iso = datetime.utcfromtimestamp(cutoff_ts).isoformat()
+                emitted = {a['link'] for a in articles}
+                for cached in state.get('articles', []):
+                    if cached.get('link') in emitted:
+                        continue
+                    if cached.get('published') and cached['published'] < cutoff_iso:
+                        continue
+                    cached.setdefault('_pub_ts', 0)
+                    articles.append(cached)
+
+            with self._state_lock:
+                self._feed_state[feed_url] = {
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                    'articles': articles,
+                    'seen_ids': (new_ids + seen_ids)[:100],
+                }
+
             print(f"✓ {source_name}: {len(articles)} articles")
             return articles
             
@@ -131,21 +273,43 @@ class RSSNewsScraper:
     def scrape_all_sources(self, days_back: int = 7) -> List[Dict]:
         """Scrape all respected sources"""
         all_articles = []
+        seen_titles = set()
         
         print(f"Scraping respected AI sources from last {days_back} days...\n")
-        
-        for source_name, feed_url in self.respected_sources.items():
-            articles = self.fetch_feed(source_name, feed_url, days_back)
-            all_articles.extend(articles)
-            time.sleep(1)  # Be polite to servers
-        
-        # Sort by publication date (newest first)
-        all_articles.sort(key=lambda x: x['published'] or '', reverse=True)
+
+        # One cutoff for the whole run, shared by every worker.
+        cutoff_ts = time.time() - days_back * 86400
+
+        # The ~30 fetches are independent network waits, so fan them across a
+        # pool instead of serializing behind 1s sleeps; per-host locks in
+        # fetch_feed keep the request rate polite.
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {
+                executor.submit(self.fetch_feed, source_name, feed_url, days_back, cutoff_ts): source_name
+                for source_name, feed_url in self.respected_sources.items()
+            }
+            for future in as_completed(futures):
+                # ArXiv, bioRxiv, and the aggregators often republish the
+                # same paper; keep the first copy of each normalized title so
+                # downstream summarization is not paid twice for one story.
+                for article in future.result():
+                    fingerprint = article['title'].lower()
+                    if fingerprint in seen_titles:
+                        continue
+                    seen_titles.add(fingerprint)
+                    all_articles.append(article)
+
+        self._save_feed_state()
+
+        # Sort by publication date (newest first); the epoch float recorded
+        # at parse time compares as plain numbers through a C-level getter
+        # instead of ISO strings through a Python lambda.
+        all_articles.sort(key=operator.itemgetter('_pub_ts'), reverse=True)
         
         print(f"\n📊 Total respected source articles: {len(all_articles)}")
         return all_articles
     
-    def save_articles(self, articles: List[Dict], filename: str = None) -> str:
+    def save_articles(self, articles: List[Dict], filename: str = None, pretty: bool = False) -> str:
         """Save articles to JSON file"""
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -153,10 +317,25 @@ class RSSNewsScraper:
         
         output_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "output")
         filepath = os.path.join(output_dir, filename)
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(articles, f, indent=2, ensure_ascii=False)
-        
+
+        # Encode in memory and write bytes in one call, via orjson when it is
+        # installed; same optional-dependency split as the Reddit scraper.
+        # The canonical copy is compact (faster to write, ~30% smaller);
+        # pass pretty=True for a human-readable dump.
+        if orjson is not None:
+            payload = orjson.dumps(articles, option=orjson.OPT_INDENT_2 if pretty else 0)
+        else:
+            payload = json.dumps(
+                articles, indent=2 if pretty else None, ensure_ascii=False
+            ).encode('utf-8')
+
+        # Write to a sibling temp file and publish with an atomic rename so
+        # a concurrent reader never observes a torn file.
+        tmp = filepath + '.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp, filepath)
+
         print(f"Articles saved to {filepath}")
         return filepath
 
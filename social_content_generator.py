@@ -2,12 +2,19 @@
 from __future__ import annotations
 
 import hashlib
+import re
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Sequence
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from content_types import SocialPost, WeeklySocialContent
 from summarizer import AISummarizer
 
+# Tokenizer shared by the inverted index and topic queries.
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
 
 class SocialContentGenerator:
     """Coordinates content generation across Bluesky, LinkedIn, and Blog platforms."""
@@ -35,10 +42,14 @@ class SocialContentGenerator:
         """
         print("\n📱 Generating social media content...")
 
+        # One clock read per run: every post, ID, and date range below
+        # shares this timestamp instead of re-querying the system clock.
+        now = datetime.now()
+
         weekly_content = WeeklySocialContent(
-            generated_at=datetime.now(),
-            week_start=(datetime.now() - timedelta(days=7)).strftime("%B %d"),
-            week_end=datetime.now().strftime("%B %d, %Y"),
+            generated_at=now,
+            week_start=(now - timedelta(days=7)).strftime("%B %d"),
+            week_end=now.strftime("%B %d, %Y"),
             total_articles_analyzed=len(articles),
             total_community_posts=len(community_posts)
         )
@@ -50,28 +61,147 @@ class SocialContentGenerator:
             print("  ⚠️  No trending topics found, using top article topics")
             primary_topics = self._extract_topics_from_articles(articles, max_topics=max_posts)
 
+        # Phase 1: filter sources per topic so prompts can be built up front.
+        # The lowered search index is built once and shared by every topic.
+        article_index, post_index, kw_index = self._build_search_index(
+            articles, community_posts
+        )
+        topic_inputs = []
         for topic_data in primary_topics:
             topic = topic_data["keyword"]
-            print(f"  📝 Generating content for: {topic}")
-
-            # Get relevant articles for this topic
             topic_articles = self._filter_articles_for_topic(
-                topic, articles, community_posts, topic_data
+                topic, article_index, post_index, kw_index, topic_data
             )
+            topic_inputs.append((topic, topic_data, topic_articles))
+
+        # With several topics, the LinkedIn and blog completions all go out
+        # in one Message Batches submission instead of 2N serial calls. A
+        # single topic (or a failed batch) falls back to the serial path.
+        batch_results: Optional[Dict[str, str]] = None
+        if len(topic_inputs) > 1:
+            batch_results = self._run_message_batch(topic_inputs, list(trends))
+
+        # On the serial path, launch every LinkedIn/blog completion before
+        # assembling any post: the Bluesky thread building and citation
+        # formatting below then run on the CPU while the API calls wait on
+        # the network.
+        linkedin_futures: Dict[int, object] = {}
+        blog_futures: Dict[int, object] = {}
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            if batch_results is None and self.summarizer.api_enabled:
+                for i, (topic, _topic_data, topic_articles) in enumerate(topic_inputs):
+                    linkedin_futures[i] = executor.submit(
+                        self.summarizer.generate_linkedin_post,
+                        topic, topic_articles["articles"], list(trends)
+                    )
+                    blog_futures[i] = executor.submit(
+                        self.summarizer.generate_blog_post,
+                        topic, topic_articles["articles"],
+                        topic_articles["community"], list(trends)
+                    )
+
+            for i, (topic, topic_data, topic_articles) in enumerate(topic_inputs):
+                print(f"  📝 Generating content for: {topic}")
+
+                linkedin_post = None
+                blog_parts = None
+                if batch_results is not None:
+                    linkedin_post = batch_results.get(f"linkedin_{i}")
+                    blog_text = batch_results.get(f"blog_{i}")
+                    if blog_text is not None:
+                        blog_parts = self.summarizer._parse_blog_response(topic, blog_text)
+                if linkedin_post is None and i in linkedin_futures:
+                    linkedin_post = linkedin_futures[i].result()
+                if blog_parts is None and i in blog_futures:
+                    blog_parts = blog_futures[i].result()
+
+                # Generate social post
+                post = self._generate_social_post(
+                    topic=topic,
+                    topic_data=topic_data,
+                    articles=topic_articles["articles"],
+                    community_posts=topic_articles["community"],
+                    trends=list(trends),
+                    now=now,
+                    linkedin_post=linkedin_post,
+                    blog_parts=blog_parts
+                )
+
+                weekly_content.add_post(post)
 
-            # Generate social post
-            post = self._generate_social_post(
-                topic=topic,
-                topic_data=topic_data,
-                articles=topic_articles["articles"],
-                community_posts=topic_articles["community"],
-                trends=list(trends)
+        print(f"  ✅ Generated {len(weekly_content.posts)} social posts")
+        return weekly_content
+
+    def _run_message_batch(
+        self,
+        topic_inputs: List[Tuple[str, Dict, Dict[str, List[Dict]]]],
+        trends: List[Dict],
+        poll_interval: float = 5.0,
+        timeout: float = 1800.0
+    ) -> Optional[Dict[str, str]]:
+        """Submit all per-topic completions as one Message Batches job.
+
+        Returns a mapping of custom_id ("linkedin_<i>" / "blog_<i>") to
+        response text, or None when the API is disabled or the batch does
+        not finish cleanly -- callers then use the serial per-topic path.
+        """
+        summarizer = self.summarizer
+        if not summarizer.api_enabled:
+            return None
+
+        requests = []
+        for i, (topic, _topic_data, topic_articles) in enumerate(topic_inputs):
+            system, prompt = summarizer._build_linkedin_prompt(
+                topic, topic_articles["articles"], trends
             )
+            requests.append({
+                "custom_id": f"linkedin_{i}",
+                "params": {
+                    "model": "claude-sonnet-4-6",
+                    "max_tokens": 1000,
+                    "temperature": 0.7,
+                    "system": system,
+                    "messages": [{"role": "user", "content": prompt}],
+                },
+            })
 
-            weekly_content.add_post(post)
+            system, prompt = summarizer._build_blog_prompt(
+                topic, topic_articles["articles"], topic_articles["community"], trends
+            )
+            requests.append({
+                "custom_id": f"blog_{i}",
+                "params": {
+                    "model": "claude-sonnet-4-6",
+                    "max_tokens": 4000,
+                    "temperature": 0.7,
+                    "system": system,
+                    "messages": [{"role": "user", "content": prompt}],
+                },
+            })
 
-        print(f"  ✅ Generated {len(weekly_content.posts)} social posts")
-        return weekly_content
+        try:
+            batch = summarizer.client.messages.batches.create(requests=requests)
+            print(f"  📦 Submitted batch {batch.id} ({len(requests)} requests)")
+
+            deadline = time.monotonic() + timeout
+            while batch.processing_status != "ended":
+                if time.monotonic() > deadline:
+                    print("  ⚠️  Batch did not finish in time, falling back to serial calls")
+                    return None
+                time.sleep(poll_interval)
+                batch = summarizer.client.messages.batches.retrieve(batch.id)
+
+            results: Dict[str, str] = {}
+            for entry in summarizer.client.messages.batches.results(batch.id):
+                if entry.result.type == "succeeded":
+                    results[entry.custom_id] = entry.result.message.content[0].text.strip()
+                else:
+                    print(f"  ⚠️  Batch request {entry.custom_id} {entry.result.type}, will retry serially")
+            return results
+
+        except Exception as e:
+            print(f"  ⚠️  Message batch failed ({e}), falling back to serial calls")
+            return None
 
     def _extract_primary_topics(
         self, trends: Sequence[Dict], max_topics: int = 3
@@ -97,22 +227,16 @@ class SocialContentGenerator:
             return []
 
         # Count keyword occurrences across articles
-        keyword_counts: Dict[str, int] = {}
+        keyword_counts: Counter = Counter()
         for article in articles:
-            keywords = article.get("keywords", [])
-            for kw in keywords:
-                if kw and len(kw) > 2:
-                    keyword_counts[kw] = keyword_counts.get(kw, 0) + 1
-
-        # Sort by count and create topic dicts
-        sorted_keywords = sorted(
-            keyword_counts.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
+            keyword_counts.update(
+                kw for kw in article.get("keywords", []) if kw and len(kw) > 2
+            )
 
+        # most_common does a heap selection of the top N rather than
+        # sorting every keyword just to keep a handful.
         topics = []
-        for keyword, count in sorted_keywords[:max_topics]:
+        for keyword, count in keyword_counts.most_common(max_topics):
             topics.append({
                 "keyword": keyword,
                 "mentions": count,
@@ -122,43 +246,89 @@ class SocialContentGenerator:
 
         return topics
 
+    def _build_search_index(
+        self, articles: Sequence[Dict], community_posts: Sequence[Dict]
+    ) -> Tuple[List[Dict], List[Dict], Dict[str, set]]:
+        """Lowercase every article and post once for reuse across topic scans.
+
+        Each entry keeps the lowered searchable fields alongside a ref back
+        to the original dict, so N topics pay for one .lower() pass instead
+        of N. An inverted token index over the articles lets topic queries
+        intersect small posting sets instead of substring-scanning every
+        article.
+        """
+        article_index = [
+            {
+                "title_l": (article.get("title") or "").lower(),
+                "summary_l": (article.get("summary") or "").lower(),
+                "keywords_l": [k.lower() for k in article.get("keywords", [])],
+                "ref": article,
+            }
+            for article in articles
+        ]
+        kw_index: Dict[str, set] = {}
+        for i, entry in enumerate(article_index):
+            text = f"{entry['title_l']} {entry['summary_l']} {' '.join(entry['keywords_l'])}"
+            for token in _TOKEN_RE.findall(text):
+                kw_index.setdefault(token, set()).add(i)
+        post_index = [
+            {
+                "title_l": (post.get("title") or "").lower(),
+                "selftext_l": (post.get("selftext") or "").lower(),
+                "ref": post,
+            }
+            for post in community_posts
+        ]
+        return article_index, post_index, kw_index
+
     def _filter_articles_for_topic(
         self,
         topic: str,
-        articles: Sequence[Dict],
-        community_posts: Sequence[Dict],
+        article_index: List[Dict],
+        post_index: List[Dict],
+        kw_index: Dict[str, set],
         topic_data: Dict
     ) -> Dict[str, List[Dict]]:
-        """Filter articles and posts relevant to a specific topic."""
+        """Filter indexed articles and posts relevant to a specific topic."""
         topic_lower = topic.lower()
 
         # Use pre-filtered sources from topic_data if available
         filtered_articles = list(topic_data.get("respected_sources", []))
         filtered_community = list(topic_data.get("community_posts", []))
 
-        # If no pre-filtered data, search manually
+        # If no pre-filtered data, intersect the inverted index: only
+        # articles containing every topic token can match, and just those
+        # candidates get the substring verification (which still guards
+        # phrase order for multi-word topics).
         if not filtered_articles:
-            for article in articles:
-                title = (article.get("title") or "").lower()
-                summary = (article.get("summary") or "").lower()
-                keywords = [k.lower() for k in article.get("keywords", [])]
-
-                if (topic_lower in title or
-                    topic_lower in summary or
-                    topic_lower in keywords):
-                    filtered_articles.append(article)
-
-        if not filtered_community:
-            for post in community_posts:
-                title = (post.get("title") or "").lower()
-                selftext = (post.get("selftext") or "").lower()
-
-                if topic_lower in title or topic_lower in selftext:
-                    filtered_community.append(post)
+            topic_tokens = _TOKEN_RE.findall(topic_lower)
+            candidates = article_index
+            if topic_tokens:
+                candidate_ids = kw_index.get(topic_tokens[0], set())
+                for token in topic_tokens[1:]:
+                    if not candidate_ids:
+                        break
+                    candidate_ids = candidate_ids & kw_index.get(token, set())
+                candidates = [article_index[i] for i in sorted(candidate_ids)]
+            for entry in candidates:
+                if (topic_lower in entry["title_l"] or
+                    topic_lower in entry["summary_l"] or
+                    topic_lower in entry["keywords_l"]):
+                    filtered_articles.append(entry["ref"])
+
+        # Community posts stay a linear scan; a memchr for the topic's
+        # first character rejects most non-matching posts before the full
+        # substring search runs.
+        if not filtered_community and topic_lower:
+            first = topic_lower[0]
+            for entry in post_index:
+                if ((first in entry["title_l"] and topic_lower in entry["title_l"]) or
+                    (first in entry["selftext_l"] and topic_lower in entry["selftext_l"])):
+                    filtered_community.append(entry["ref"])
 
         # Fallback: use top articles if no matches
-        if not filtered_articles and articles:
-            filtered_articles = list(articles[:3])
+        if not filtered_articles and article_index:
+            filtered_articles = [entry["ref"] for entry in article_index[:3]]
 
         return {
             "articles": filtered_articles[:5],
@@ -171,26 +341,37 @@ class SocialContentGenerator:
         topic_data: Dict,
         articles: List[Dict],
         community_posts: List[Dict],
-        trends: List[Dict]
+        trends: List[Dict],
+        now: datetime,
+        linkedin_post: Optional[str] = None,
+        blog_parts: Optional[Tuple[str, str, str]] = None
     ) -> SocialPost:
-        """Generate a complete SocialPost with content for all platforms."""
+        """Generate a complete SocialPost with content for all platforms.
+
+        now is the shared run timestamp; linkedin_post and blog_parts
+        carry pre-generated text from a message batch, and when absent
+        the summarizer is called directly.
+        """
         # Generate unique ID
-        post_id = self._generate_post_id(topic)
+        post_id = self._generate_post_id(topic, now)
 
         # Build Bluesky thread
         bluesky_posts = self._build_bluesky_thread(
-            topic, topic_data, articles, community_posts
+            topic, topic_data, articles, community_posts, now
         )
 
         # Generate LinkedIn post
-        linkedin_post = self.summarizer.generate_linkedin_post(
-            topic, articles, trends
-        )
+        if linkedin_post is None:
+            linkedin_post = self.summarizer.generate_linkedin_post(
+                topic, articles, trends
+            )
 
         # Generate blog post
-        blog_title, blog_content, blog_meta = self.summarizer.generate_blog_post(
-            topic, articles, community_posts, trends
-        )
+        if blog_parts is None:
+            blog_parts = self.summarizer.generate_blog_post(
+                topic, articles, community_posts, trends
+            )
+        blog_title, blog_content, blog_meta = blog_parts
 
         # Build citations list
         citations = []
@@ -210,23 +391,26 @@ class SocialContentGenerator:
             blog_title=blog_title,
             blog_content=blog_content,
             blog_meta_description=blog_meta,
-            generated_at=datetime.now(),
+            generated_at=now,
             model_used="claude-3-7-sonnet-20250219",
             citations=citations
         )
 
-    def _generate_post_id(self, topic: str) -> str:
+    def _generate_post_id(self, topic: str, now: datetime) -> str:
         """Generate a unique ID for a social post."""
-        timestamp = datetime.now().isoformat()
+        timestamp = now.isoformat()
         hash_input = f"{topic}_{timestamp}"
-        return f"post_{hashlib.md5(hash_input.encode()).hexdigest()[:12]}"
+        # blake2b sized to the 12 hex chars the IDs always used, without
+        # computing and discarding most of an md5 digest.
+        return f"post_{hashlib.blake2b(hash_input.encode(), digest_size=6).hexdigest()}"
 
     def _build_bluesky_thread(
         self,
         topic: str,
         topic_data: Dict,
         articles: List[Dict],
-        community_posts: List[Dict]
+        community_posts: List[Dict],
+        now: datetime
     ) -> List[str]:
         """Build a Bluesky thread (3-5 posts) for a topic.
 
@@ -251,8 +435,11 @@ class SocialContentGenerator:
         if articles and len(articles) > 0:
             summary = articles[0].get("summary", "")
             if summary:
-                # Extract first sentence or truncate
-                first_sentence = summary.split(".")[0] + "."
+                # Extract first sentence or truncate. find() stops at the
+                # first period instead of split() slicing up the whole
+                # summary; a period-free summary is just bounded.
+                i = summary.find(".")
+                first_sentence = summary[:i + 1] if i != -1 else summary[:280]
                 if len(first_sentence) > 280:
                     first_sentence = first_sentence[:277] + "..."
                 posts.append(first_sentence)
@@ -284,7 +471,7 @@ class SocialContentGenerator:
                 posts.append(source_text)
 
         # Post 5: CTA
-        today = datetime.now().strftime("%b %d")
+        today = now.strftime("%b %d")
         cta = f"Full analysis in BioAI Weekly ({today}). Subscribe for weekly research + community insights. {hashtag}"
         if len(cta) > 300:
             cta = f"Full analysis in BioAI Weekly ({today}). {hashtag}"
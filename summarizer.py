@@ -1,4 +1,6 @@
+import hashlib
 import json
+import threading
 import anthropic
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime
@@ -9,6 +11,16 @@ from pathlib import Path
 # Path to stop_slop knowledge base
 STOP_SLOP_DIR = Path(__file__).parent / "stop_slop"
 
+# Persisted prompt/response cache so reruns (and shared stories across
+# sections) reuse Claude responses instead of paying for the same call twice.
+PROMPT_CACHE_PATH = Path(__file__).parent / "output" / "prompt_cache.json"
+
+# Text-cleanup and citation patterns compiled once instead of per call.
+_RE_NL = re.compile(r'\n+')
+_RE_WS = re.compile(r'\s+')
+_RE_ARTIFACT = re.compile(r'(Continue reading|Read more|Click here)', re.IGNORECASE)
+_RE_CITE = re.compile(r'\[(\d+)\]')
+
 class AISummarizer:
     def __init__(self, api_key: str = None):
         """Initialize with Anthropic API key. Set ANTHROPIC_API_KEY environment variable or pass directly."""
@@ -23,6 +35,77 @@ class AISummarizer:
             self.api_enabled = True
             print("✅ Claude AI summarization enabled")
         self.stop_slop_content = self._load_stop_slop()
+        self._prompt_cache = self._load_prompt_cache()
+        # Callers fan completions across threads; serialize cache writes so
+        # concurrent misses do not interleave the persisted file.
+        self._prompt_cache_lock = threading.Lock()
+        # Per-run memos: cleaned text keyed by the raw string, and article
+        # snippets keyed by id(article) -- safe because the article dicts
+        # live in the pipeline's lists for the whole run.
+        self._clean_cache: Dict[str, str] = {}
+        self._snippet_cache: Dict[int, str] = {}
+
+    def _load_prompt_cache(self) -> Dict[str, str]:
+        """Load the persisted prompt cache, tolerating a missing or stale file."""
+        try:
+            with open(PROMPT_CACHE_PATH, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            if isinstance(cache, dict):
+                return cache
+        except (OSError, ValueError):
+            pass
+        return {}
+
+    def _save_prompt_cache(self) -> None:
+        """Persist the prompt cache atomically next to the other output files."""
+        tmp_path = PROMPT_CACHE_PATH.with_suffix('.json.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._prompt_cache, f, ensure_ascii=False)
+            os.replace(tmp_path, PROMPT_CACHE_PATH)
+        except OSError as e:
+            print(f"  Warning: could not persist prompt cache: {e}")
+
+    @staticmethod
+    def _cache_key(system: str, prompt: str, model: str, temperature: float) -> str:
+        """Hash everything that affects a completion into a cache key."""
+        return hashlib.sha256(
+            f"{model}|{temperature}|{system}|{prompt}".encode()
+        ).hexdigest()
+
+    def _cached_complete(self, system: str, prompt: str, model: str,
+                         max_tokens: int, temperature: float) -> str:
+        """Run a Claude completion through the persistent response cache.
+
+        The key hashes everything that affects the response (model, system
+        prompt, user prompt, temperature), so a hit is always an exact
+        replay. Misses call the API and are persisted for future runs.
+        """
+        cache_key = self._cache_key(system, prompt, model, temperature)
+
+        cached = self._prompt_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Stream instead of a blocking create: tokens are consumed as they
+        # arrive, which avoids buffering long completions (the blog posts
+        # run to 4000 tokens) behind one response and the idle-connection
+        # timeouts that come with it.
+        with self.client.messages.stream(
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=system,
+            messages=[
+                {"role": "user", "content": prompt}
+            ]
+        ) as stream:
+            text = stream.get_final_text().strip()
+
+        with self._prompt_cache_lock:
+            self._prompt_cache[cache_key] = text
+            self._save_prompt_cache()
+        return text
 
     def _load_stop_slop(self) -> str:
         """Load the stop_slop knowledge base files."""
@@ -68,49 +151,64 @@ Study these carefully and apply them rigorously to all generated content.
         if not text:
             return ""
         
+        cached = self._clean_cache.get(text)
+        if cached is not None:
+            return cached
+
         # Remove excessive newlines and spaces
-        text = re.sub(r'\n+', ' ', text)
-        text = re.sub(r'\s+', ' ', text)
-        
+        cleaned = _RE_NL.sub(' ', text)
+        cleaned = _RE_WS.sub(' ', cleaned)
+
         # Remove common web artifacts
-        text = re.sub(r'(Continue reading|Read more|Click here)', '', text, flags=re.IGNORECASE)
-        
-        return text.strip()
+        cleaned = _RE_ARTIFACT.sub('', cleaned)
 
-    def format_article_for_prompt(self, index: int, article: Dict) -> str:
-        """Assemble a structured snippet with metadata for prompting."""
-        title = article.get('title', 'Untitled')
-        source = article.get('source') or article.get('subreddit', 'Unknown')
-        published = article.get('published') or article.get('created_utc') or 'Unknown date'
-        summary = article.get('summary') or article.get('selftext') or ''
-        summary = self.clean_text_for_summary(summary)[:600]
+        cleaned = cleaned.strip()
+        self._clean_cache[text] = cleaned
+        return cleaned
 
-        metrics = []
-        score = article.get('score')
-        comments = article.get('num_comments')
-        sentiment = article.get('sentiment')
-        if score is not None:
-            metrics.append(f"Score: {score}")
-        if comments is not None and comments > 0:
-            metrics.append(f"Comments: {comments}")
-        if sentiment:
-            metrics.append(f"Sentiment: {sentiment}")
+    def format_article_for_prompt(self, index: int, article: Dict) -> str:
+        """Assemble a structured snippet with metadata for prompting.
 
-        metric_line = ", ".join(metrics) if metrics else "None reported"
+        The snippet body is memoized per article dict; only the citation
+        index varies between prompts, so it is prepended on retrieval.
+        """
+        body = self._snippet_cache.get(id(article))
+        if body is None:
+            title = article.get('title', 'Untitled')
+            source = article.get('source') or article.get('subreddit', 'Unknown')
+            published = article.get('published') or article.get('created_utc') or 'Unknown date'
+            summary = article.get('summary') or article.get('selftext') or ''
+            summary = self.clean_text_for_summary(summary)[:600]
+
+            metrics = []
+            score = article.get('score')
+            comments = article.get('num_comments')
+            sentiment = article.get('sentiment')
+            if score is not None:
+                metrics.append(f"Score: {score}")
+            if comments is not None and comments > 0:
+                metrics.append(f"Comments: {comments}")
+            if sentiment:
+                metrics.append(f"Sentiment: {sentiment}")
+
+            metric_line = ", ".join(metrics) if metrics else "None reported"
+
+            body = (
+                f"Title: {title}\n"
+                f"Source: {source}\n"
+                f"Published: {published}\n"
+                f"Metrics: {metric_line}\n"
+                f"Summary: {summary}"
+            )
+            self._snippet_cache[id(article)] = body
 
-        return (
-            f"[{index}] Title: {title}\n"
-            f"Source: {source}\n"
-            f"Published: {published}\n"
-            f"Metrics: {metric_line}\n"
-            f"Summary: {summary}"
-        )
+        return f"[{index}] {body}"
 
     def qa_check_summary(self, summary: str, citations: List[str]) -> Tuple[str, List[str]]:
         """Flag mismatches between inline citations and provided sources."""
         issues: List[str] = []
 
-        citation_refs = set(re.findall(r'\[(\d+)\]', summary))
+        citation_refs = set(_RE_CITE.findall(summary))
         valid_refs = {str(i + 1) for i in range(len(citations))}
 
         if citations and not citation_refs:
@@ -215,17 +313,13 @@ Summary:"""
             base_prompt = "You are a skilled tech journalist writing for an AI newsletter. Create engaging, informative summaries that capture both technical details and human interest."
             system_prompt = self._build_system_prompt(base_prompt)
 
-            response = self.client.messages.create(
+            summary_text = self._cached_complete(
+                system=system_prompt,
+                prompt=prompt,
                 model="claude-sonnet-4-6",
                 max_tokens=400,
                 temperature=0.7,
-                system=system_prompt,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
             )
-
-            summary_text = response.content[0].text.strip()
             summary_text, issues = self.qa_check_summary(summary_text, citations)
             if issues:
                 print(f"⚠️  QA flags for topic '{topic}': {', '.join(issues)}")
@@ -304,17 +398,13 @@ Summary:"""
             base_prompt = "You are writing concise, engaging summaries for an AI newsletter audience."
             system_prompt = self._build_system_prompt(base_prompt)
 
-            response = self.client.messages.create(
+            summary_text = self._cached_complete(
+                system=system_prompt,
+                prompt=prompt,
                 model="claude-sonnet-4-6",
                 max_tokens=250,
                 temperature=0.6,
-                system=system_prompt,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
             )
-
-            summary_text = response.content[0].text.strip()
             summary_text, issues = self.qa_check_summary(summary_text, [])
             if issues:
                 print(f"⚠️  QA flags for story '{title}': {', '.join(issues)}")
@@ -325,6 +415,75 @@ Summary:"""
             print(f"❌ Error summarizing individual story: {str(e)}")
             return self.create_fallback_summary([article]), source_link
     
+    def summarize_many(self, articles: List[Dict], context: str = "respected") -> List[tuple[str, str]]:
+        """Summarize several stories in one API call.
+
+        Returns one (summary, source_link) pair per article, in order --
+        the same shape as summarize_individual_story. A batch of N stories
+        costs a single round trip instead of N; if the batched response
+        cannot be parsed, each story falls back to an individual call.
+        """
+        if not articles:
+            return []
+
+        if not self.api_enabled or len(articles) == 1:
+            return [self.summarize_individual_story(a, context=context) for a in articles]
+
+        source_links = [a.get('link', '') or a.get('url', '') for a in articles]
+        content_parts = [
+            self.format_article_for_prompt(i, article)
+            for i, article in enumerate(articles, 1)
+        ]
+        combined_content = "\n\n".join(content_parts)
+
+        if context == "respected":
+            tone_line = "- Each summary: two paragraphs of two sentences; development first, then significance and likely next steps. Concrete language, no hype."
+        else:  # community context
+            tone_line = "- Each summary: two conversational paragraphs (2 sentences each); the topic and why it surfaced, then viewpoints and sentiment from the engagement data."
+
+        prompt = f"""Summarize each of the following {len(articles)} AI news stories for a newsletter.
+
+Requirements:
+{tone_line}
+- Do not invent details; stay grounded in the provided material.
+- No headers, titles, or markdown formatting inside the summaries.
+- Respond with ONLY a JSON array of {len(articles)} strings, one summary per story, in the same order as the numbered stories below.
+
+Source material:
+{combined_content}
+
+JSON array:"""
+
+        try:
+            base_prompt = "You are writing concise, engaging summaries for an AI newsletter audience."
+            system_prompt = self._build_system_prompt(base_prompt)
+
+            response_text = self._cached_complete(
+                system=system_prompt,
+                prompt=prompt,
+                model="claude-sonnet-4-6",
+                max_tokens=250 * len(articles),
+                temperature=0.6,
+            )
+            # Tolerate prose or code fences around the array.
+            json_start = response_text.find('[')
+            json_end = response_text.rfind(']')
+            summaries = json.loads(response_text[json_start:json_end + 1])
+            if not isinstance(summaries, list) or len(summaries) != len(articles):
+                raise ValueError(f"expected {len(articles)} summaries, got {summaries!r:.80}")
+
+            results = []
+            for article, summary, link in zip(articles, summaries, source_links):
+                summary_text, issues = self.qa_check_summary(str(summary).strip(), [])
+                if issues:
+                    print(f"⚠️  QA flags for story '{article.get('title', '')}': {', '.join(issues)}")
+                results.append((summary_text, link))
+            return results
+
+        except Exception as e:
+            print(f"❌ Error with batched summarization, retrying individually: {str(e)}")
+            return [self.summarize_individual_story(a, context=context) for a in articles]
+
     def generate_section_intro(self, section_name: str, article_count: int) -> str:
         """Generate engaging introductions for newsletter sections"""
         if not self.api_enabled:
@@ -342,18 +501,14 @@ Summary:"""
             base_prompt = "You are writing engaging newsletter section introductions. Keep them brief, punchy, and appropriate for the tone."
             system_prompt = self._build_system_prompt(base_prompt)
 
-            response = self.client.messages.create(
+            return self._cached_complete(
+                system=system_prompt,
+                prompt=prompt,
                 model="claude-sonnet-4-6",
                 max_tokens=100,
                 temperature=0.8,
-                system=system_prompt,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
             )
 
-            return response.content[0].text.strip()
-
         except Exception as e:
             print(f"❌ Error generating section intro: {str(e)}")
             return f"Here's what happened in {section_name.lower()} this week:"
@@ -374,6 +529,29 @@ Summary:"""
         if not self.api_enabled:
             return f"This week in {topic}: Key developments are reshaping the field. Read our full analysis in the newsletter."
 
+        system_prompt, prompt = self._build_linkedin_prompt(topic, articles, trends)
+
+        try:
+            return self._cached_complete(
+                system=system_prompt,
+                prompt=prompt,
+                model="claude-sonnet-4-6",
+                max_tokens=1000,
+                temperature=0.7,
+            )
+
+        except Exception as e:
+            print(f"❌ Error generating LinkedIn post: {str(e)}")
+            return f"This week in {topic}: Key developments are reshaping the field. Read our full analysis in the newsletter."
+
+    def _build_linkedin_prompt(
+        self, topic: str, articles: List[Dict], trends: List[Dict]
+    ) -> Tuple[str, str]:
+        """Build the (system, user) prompt pair for a LinkedIn post.
+
+        Split out from generate_linkedin_post so batched callers can
+        assemble requests without triggering the completion themselves.
+        """
         # Prepare article content for prompt
         content_parts: List[str] = []
         for i, article in enumerate(articles[:5], 1):
@@ -409,23 +587,8 @@ SOURCE MATERIAL:
 
 Write the LinkedIn post now:"""
 
-        try:
-            base_prompt = "You are a respected voice in AI and computational biology, writing thoughtful LinkedIn content that provides genuine insight rather than engagement bait."
-            system_prompt = self._build_system_prompt(base_prompt)
-
-            response = self.client.messages.create(
-                model="claude-sonnet-4-6",
-                max_tokens=1000,
-                temperature=0.7,
-                system=system_prompt,
-                messages=[{"role": "user", "content": prompt}]
-            )
-
-            return response.content[0].text.strip()
-
-        except Exception as e:
-            print(f"❌ Error generating LinkedIn post: {str(e)}")
-            return f"This week in {topic}: Key developments are reshaping the field. Read our full analysis in the newsletter."
+        base_prompt = "You are a respected voice in AI and computational biology, writing thoughtful LinkedIn content that provides genuine insight rather than engagement bait."
+        return self._build_system_prompt(base_prompt), prompt
 
     def generate_blog_post(
         self,
@@ -451,6 +614,39 @@ Write the LinkedIn post now:"""
             meta = f"Weekly analysis of {topic} developments in AI and biology research."
             return title, content, meta
 
+        system_prompt, prompt = self._build_blog_prompt(
+            topic, articles, community_posts, trends
+        )
+
+        try:
+            response_text = self._cached_complete(
+                system=system_prompt,
+                prompt=prompt,
+                model="claude-sonnet-4-6",
+                max_tokens=4000,
+                temperature=0.7,
+            )
+            return self._parse_blog_response(topic, response_text)
+
+        except Exception as e:
+            print(f"❌ Error generating blog post: {str(e)}")
+            title = f"Weekly Analysis: {topic.title()}"
+            content = f"This week's developments in {topic} highlight ongoing progress in the field."
+            meta = f"Weekly analysis of {topic} developments in AI and biology research."
+            return title, content, meta
+
+    def _build_blog_prompt(
+        self,
+        topic: str,
+        articles: List[Dict],
+        community_posts: List[Dict],
+        trends: List[Dict]
+    ) -> Tuple[str, str]:
+        """Build the (system, user) prompt pair for a blog post.
+
+        Split out from generate_blog_post so batched callers can assemble
+        requests without triggering the completion themselves.
+        """
         # Prepare article content
         article_parts: List[str] = []
         citations: List[str] = []
@@ -536,56 +732,39 @@ META: [Your meta description here]
 CONTENT:
 [Your full blog post here]"""
 
-        try:
-            base_prompt = "You are the lead writer for BioAI Weekly, producing in-depth analysis that bridges cutting-edge research and practical implications. Your writing is respected for its technical accuracy and clarity."
-            system_prompt = self._build_system_prompt(base_prompt)
-
-            response = self.client.messages.create(
-                model="claude-sonnet-4-6",
-                max_tokens=4000,
-                temperature=0.7,
-                system=system_prompt,
-                messages=[{"role": "user", "content": prompt}]
-            )
-
-            response_text = response.content[0].text.strip()
-
-            # Parse the response
-            title = topic.title()
-            meta = f"Weekly analysis of {topic} in AI and biology research."
-            content = response_text
-
-            # Extract title
-            if "TITLE:" in response_text:
-                title_start = response_text.find("TITLE:") + 6
-                title_end = response_text.find("\n", title_start)
-                if title_end > title_start:
-                    title = response_text[title_start:title_end].strip()
-
-            # Extract meta description
-            if "META:" in response_text:
-                meta_start = response_text.find("META:") + 5
-                meta_end = response_text.find("\n", meta_start)
-                if meta_end > meta_start:
-                    meta = response_text[meta_start:meta_end].strip()
-
-            # Extract content
-            if "CONTENT:" in response_text:
-                content_start = response_text.find("CONTENT:") + 8
-                content = response_text[content_start:].strip()
-            elif "## TL;DR" in response_text:
-                # Content starts at TL;DR if no CONTENT marker
-                content_start = response_text.find("## TL;DR")
-                content = response_text[content_start:].strip()
-
-            return title, content, meta
-
-        except Exception as e:
-            print(f"❌ Error generating blog post: {str(e)}")
-            title = f"Weekly Analysis: {topic.title()}"
-            content = f"This week's developments in {topic} highlight ongoing progress in the field."
-            meta = f"Weekly analysis of {topic} developments in AI and biology research."
-            return title, content, meta
+        base_prompt = "You are the lead writer for BioAI Weekly, producing in-depth analysis that bridges cutting-edge research and practical implications. Your writing is respected for its technical accuracy and clarity."
+        return self._build_system_prompt(base_prompt), prompt
+
+    def _parse_blog_response(self, topic: str, response_text: str) -> tuple[str, str, str]:
+        """Split a TITLE/META/CONTENT blog response into its three parts."""
+        title = topic.title()
+        meta = f"Weekly analysis of {topic} in AI and biology research."
+        content = response_text
+
+        # Extract title
+        if "TITLE:" in response_text:
+            title_start = response_text.find("TITLE:") + 6
+            title_end = response_text.find("\n", title_start)
+            if title_end > title_start:
+                title = response_text[title_start:title_end].strip()
+
+        # Extract meta description
+        if "META:" in response_text:
+            meta_start = response_text.find("META:") + 5
+            meta_end = response_text.find("\n", meta_start)
+            if meta_end > meta_start:
+                meta = response_text[meta_start:meta_end].strip()
+
+        # Extract content
+        if "CONTENT:" in response_text:
+            content_start = response_text.find("CONTENT:") + 8
+            content = response_text[content_start:].strip()
+        elif "## TL;DR" in response_text:
+            # Content starts at TL;DR if no CONTENT marker
+            content_start = response_text.find("## TL;DR")
+            content = response_text[content_start:].strip()
+
+        return title, content, meta
 
 
 if __name__ == "__main__":